@@ -0,0 +1,270 @@
+"""
+Async Runner - Runs many development requests concurrently
+
+Sends requirements through the complete protocol with AsyncAnthropic:
+- One shared client (and therefore one shared connection pool)
+- A semaphore bounding the number of in-flight requests
+- A token bucket limiting requests per minute
+- Retries with jittered exponential backoff on 429/529
+
+Usage:
+    python async_runner.py requirements.txt --concurrency 8 --rpm 50
+    python async_runner.py --fake --requests 200     # offline throughput
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+from instrumentation import instrument, request_labels
+from protocol_request import build_protocol_message, build_request_params
+
+RETRYABLE_STATUS = {429, 529}
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for asyncio
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size (defaults to rate, at least 1)
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until a token is available and consumes it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def backoff_delay(attempt, base_delay=0.5, max_delay=30.0):
+    """
+    Computes a full-jitter exponential backoff delay
+
+    Args:
+        attempt: Retry number (0 for the first retry)
+        base_delay: Delay for the first retry
+        max_delay: Upper bound for the delay
+
+    Returns:
+        float with seconds to wait
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+async def create_with_retries(client, params, max_retries=5, base_delay=0.5, prompt_name=None, bucket=None):
+    """
+    Calls client.beta.messages.create retrying on 429/529
+
+    With a token bucket, every attempt (retries included) takes a token,
+    so backing off after a 429 never exceeds the rate limit.
+
+    With an instrumented client, the attempts go through the unwrapped
+    client and the logical request is recorded once: its retries on
+    success, or a single error once retries are exhausted.
+
+    Args:
+        client: AsyncAnthropic client (instrumented or not)
+        params: Request parameters
+        max_retries: Maximum number of retries
+        base_delay: Delay for the first retry
+        prompt_name: Prompt label of the metrics
+        bucket: Optional TokenBucket acquired before each attempt
+
+    Returns:
+        tuple (response, retries)
+    """
+    from anthropic import APIStatusError
+
+    registry = getattr(client, "registry", None)
+    messages = (client.unwrapped if registry else client).beta.messages
+    labels = request_labels(params, prompt_name)
+    started = time.perf_counter()
+    for attempt in range(max_retries + 1):
+        if bucket:
+            await bucket.acquire()
+        try:
+            raw = await messages.with_raw_response.create(**params)
+            response = await raw.parse()
+        except APIStatusError as e:
+            if e.status_code not in RETRYABLE_STATUS or attempt == max_retries:
+                if registry:
+                    registry.record_error(labels, e)
+                raise
+            delay = backoff_delay(attempt, base_delay)
+            retry_after = e.response.headers.get("retry-after")
+            if retry_after and retry_after.replace(".", "", 1).isdigit():
+                delay = max(delay, float(retry_after))
+            await asyncio.sleep(delay)
+        except Exception as e:
+            if registry:
+                registry.record_error(labels, e)
+            raise
+        else:
+            retries = attempt + raw.retries_taken
+            if registry:
+                registry.record(labels, time.perf_counter() - started, response.usage, retries=retries)
+            return response, retries
+
+async def run_requirements(client, requirements, project_context=None, concurrency=8,
+                           requests_per_minute=50, max_retries=5, max_tokens=8192, base_delay=0.5):
+    """
+    Runs several requirements through the protocol concurrently
+
+    Args:
+        client: Shared AsyncAnthropic client
+        requirements: List of requirement strings
+        project_context: Optional project context included in every prompt
+        concurrency: Maximum number of in-flight requests
+        requests_per_minute: Rate limit applied before each attempt (retries included)
+        max_retries: Maximum retries per request on 429/529
+        max_tokens: Maximum tokens per response
+        base_delay: Backoff delay for the first retry
+
+    Returns:
+        list of dicts (same order as requirements) with response or error
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(requests_per_minute / 60.0)
+
+    async def run_one(requirement):
+        params = build_request_params(
+            build_protocol_message(requirement, project_context),
+            max_tokens=max_tokens
+        )
+        result = {'requirement': requirement, 'response': None, 'error': None, 'retries': 0}
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result['response'], result['retries'] = await create_with_retries(
+                    client, params, max_retries=max_retries, base_delay=base_delay, bucket=bucket
+                )
+            except Exception as e:
+                result['error'] = e
+            result['latency'] = time.perf_counter() - started
+        return result
+
+    return await asyncio.gather(*(run_one(r) for r in requirements))
+
+def create_async_client(api_key=None, base_url=None):
+    """
+    Creates the AsyncAnthropic client shared by all requests
+
+    SDK retries are disabled so that create_with_retries alone decides
+    when and how long to back off. Calls are recorded in
+    instrumentation.METRICS.
+
+    Args:
+        api_key: API key (defaults to ANTHROPIC_API_KEY)
+        base_url: Optional API base URL (e.g. a FakeAnthropicServer)
+
+    Returns:
+        Instrumented AsyncAnthropic client
+    """
+    from anthropic import AsyncAnthropic
+
+    return instrument(AsyncAnthropic(api_key=api_key, base_url=base_url, max_retries=0))
+
+def summarize(results, elapsed):
+    """
+    Summarizes a run
+
+    Args:
+        results: Results from run_requirements
+        elapsed: Wall-clock seconds for the whole run
+
+    Returns:
+        dict with throughput and error statistics
+    """
+    succeeded = [r for r in results if r['error'] is None]
+    latencies = sorted(r['latency'] for r in results)
+    return {
+        'requests': len(results),
+        'succeeded': len(succeeded),
+        'failed': len(results) - len(succeeded),
+        'retries': sum(r['retries'] for r in results),
+        'elapsed': elapsed,
+        'throughput': len(results) / elapsed if elapsed > 0 else 0,
+        'p50_latency': latencies[len(latencies) // 2] if latencies else 0,
+        'max_latency': latencies[-1] if latencies else 0
+    }
+
+async def main_async(args):
+    server = None
+    if args.fake:
+        from fake_anthropic_server import FakeAnthropicServer
+
+        server = FakeAnthropicServer(latency=args.fake_latency,
+                                     failure_rate=args.fake_failure_rate).start()
+        client = create_async_client(api_key="fake-key", base_url=server.url)
+        requirements = [f"Fake requirement {i}" for i in range(args.requests)]
+    else:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        if not os.getenv("ANTHROPIC_API_KEY"):
+            raise ValueError("ANTHROPIC_API_KEY not found. Configure your .env file.")
+        client = create_async_client()
+        source = open(args.requirements_file) if args.requirements_file else sys.stdin
+        with source:
+            requirements = [line.strip() for line in source if line.strip()]
+
+    try:
+        started = time.perf_counter()
+        results = await run_requirements(
+            client, requirements,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            max_retries=args.max_retries
+        )
+        summary = summarize(results, time.perf_counter() - started)
+    finally:
+        await client.close()
+        if server:
+            server.stop()
+
+    print("=" * 80)
+    print("ASYNC RUN SUMMARY")
+    print("=" * 80)
+    print(f"Requests:   {summary['succeeded']}/{summary['requests']} succeeded "
+          f"({summary['retries']} retries)")
+    print(f"Elapsed:    {summary['elapsed']:.2f}s")
+    print(f"Throughput: {summary['throughput']:.1f} req/s")
+    print(f"Latency:    p50 {summary['p50_latency']:.3f}s, max {summary['max_latency']:.3f}s")
+    for result in results:
+        if result['error'] is not None:
+            print(f"❌ {result['requirement'][:60]}: {result['error']}")
+    return 0 if summary['failed'] == 0 else 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Run development requests concurrently")
+    parser.add_argument("requirements_file", nargs="?",
+                        help="File with one requirement per line (default: stdin)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rpm", type=float, default=50, help="Requests per minute")
+    parser.add_argument("--max-retries", type=int, default=5)
+    parser.add_argument("--fake", action="store_true",
+                        help="Run against an in-process fake server")
+    parser.add_argument("--requests", type=int, default=100,
+                        help="Number of requests in --fake mode")
+    parser.add_argument("--fake-latency", type=float, default=0.05)
+    parser.add_argument("--fake-failure-rate", type=float, default=0.1)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
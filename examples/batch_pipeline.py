@@ -0,0 +1,383 @@
+"""
+Batch Pipeline - Sends many development requests through the Message Batches API
+
+For offline bulk runs (e.g. nightly jobs): requirements are packed into
+Message Batches submissions (billed at the batch discount), polled with
+backoff and their results streamed to a JSONL file matched by custom_id.
+
+Progress is kept in a local state file, so an interrupted run resumes
+where it stopped instead of resubmitting work. A chunk is recorded as
+"submitting" before its batch is created; if the run dies before the
+batch id is saved, the batch is found again on resume by listing the
+recent batches (same request count, created after the submission):
+
+    python batch_pipeline.py requirements.jsonl results.jsonl
+    python batch_pipeline.py requirements.txt results.jsonl --fake
+
+Input lines are either plain requirements or JSON objects with
+"requirement" and optional "custom_id" / "project_context".
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from protocol_request import PROTOCOL_BETAS, build_protocol_message, build_request_params
+
+MAX_BATCH_REQUESTS = 10000
+# Tolerance between the local clock and the API created_at timestamps
+SUBMISSION_CLOCK_SKEW = 300
+CUSTOM_ID_PATTERN = re.compile(r'^[a-zA-Z0-9_-]{1,64}$')
+
+def load_requirements(input_path):
+    """
+    Loads requirements from a text or JSONL file
+
+    Args:
+        input_path: File with one requirement (or JSON object) per line
+
+    Returns:
+        list of dicts with custom_id, requirement and project_context
+    """
+    requirements = []
+    with open(input_path, encoding='utf-8') as f:
+        for index, line in enumerate(f):
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line) if line.startswith('{') else {'requirement': line}
+            custom_id = item.get('custom_id') or f"req-{index:06d}"
+            if not CUSTOM_ID_PATTERN.match(custom_id):
+                raise ValueError(f"Invalid custom_id {custom_id!r} on line {index + 1}")
+            requirements.append({
+                'custom_id': custom_id,
+                'requirement': item['requirement'],
+                'project_context': item.get('project_context')
+            })
+
+    seen = set()
+    for item in requirements:
+        if item['custom_id'] in seen:
+            raise ValueError(f"Duplicate custom_id {item['custom_id']!r}")
+        seen.add(item['custom_id'])
+    return requirements
+
+def load_state(state_path):
+    """
+    Loads the pipeline state (submitted batches and their progress)
+
+    Args:
+        state_path: Path of the state file
+
+    Returns:
+        dict with the state
+    """
+    if Path(state_path).exists():
+        with open(state_path, encoding='utf-8') as f:
+            return json.load(f)
+    return {'batches': []}
+
+def save_state(state_path, state):
+    """
+    Saves the pipeline state atomically
+
+    Args:
+        state_path: Path of the state file
+        state: Dict with the state
+    """
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+def truncate_partial_line(output_path, block_size=65536):
+    """
+    Drops a trailing partial line left by an interrupted write
+
+    Otherwise the next record would be appended to it and both lost.
+
+    Args:
+        output_path: JSONL results file
+        block_size: Bytes read per step while looking for the last newline
+
+    Returns:
+        int with the number of bytes removed
+    """
+    if not Path(output_path).exists():
+        return 0
+    with open(output_path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            block = f.read(end - start)
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        if end < size:
+            f.truncate(end)
+        return size - end
+
+def exported_ids(output_path):
+    """
+    Returns the custom_ids already written to the output file
+
+    Args:
+        output_path: JSONL results file
+
+    Returns:
+        set of custom_ids
+    """
+    ids = set()
+    if Path(output_path).exists():
+        with open(output_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    ids.add(json.loads(line)['custom_id'])
+                except (ValueError, KeyError):
+                    continue  # Not a result record
+    return ids
+
+def batch_request_count(batch):
+    """Returns the total number of requests of a batch object"""
+    counts = batch.request_counts
+    return counts.processing + counts.succeeded + counts.errored + counts.canceled + counts.expired
+
+def reconcile_submissions(client, state, state_path):
+    """
+    Resolves the chunks left "submitting" by an interrupted run
+
+    Recent batches (newest first) are matched by request count and
+    creation time, skipping the batches already in the state. Chunks
+    without a match were never created and are dropped so they are
+    submitted again.
+
+    Args:
+        client: Anthropic client
+        state: Pipeline state (updated in place)
+        state_path: Path of the state file
+    """
+    unresolved = [b for b in state['batches'] if b['status'] == 'submitting']
+    if not unresolved:
+        return
+    known = {b['id'] for b in state['batches'] if b['id']}
+    oldest = min(b['submitted_at'] for b in unresolved) - SUBMISSION_CLOCK_SKEW
+    candidates = []
+    for batch in client.beta.messages.batches.list(limit=100, betas=PROTOCOL_BETAS):
+        if batch.created_at.timestamp() < oldest:
+            break
+        if batch.id not in known:
+            candidates.append(batch)
+
+    for batch_state in unresolved:
+        match = next((batch for batch in reversed(candidates)
+                      if batch_request_count(batch) == len(batch_state['custom_ids'])
+                      and batch.created_at.timestamp() >= batch_state['submitted_at'] - SUBMISSION_CLOCK_SKEW),
+                     None)
+        if match is None:
+            state['batches'].remove(batch_state)
+            print(f"↩️  {len(batch_state['custom_ids'])} requests were not submitted, resubmitting")
+            continue
+        candidates.remove(match)
+        batch_state['id'] = match.id
+        batch_state['status'] = match.processing_status
+        print(f"🔗 Recovered batch {match.id} ({len(batch_state['custom_ids'])} requests)")
+    save_state(state_path, state)
+
+def submit_pending(client, requirements, state, state_path, batch_size=MAX_BATCH_REQUESTS,
+                   max_tokens=4096):
+    """
+    Submits the requirements that are not in any batch yet
+
+    Each chunk is saved as "submitting" before the batch is created, so a
+    crash in between is reconciled on resume instead of billed twice.
+
+    Args:
+        client: Anthropic client
+        requirements: Requirements from load_requirements
+        state: Pipeline state
+        state_path: Path of the state file
+        batch_size: Maximum requests per batch
+        max_tokens: Maximum tokens per response
+    """
+    reconcile_submissions(client, state, state_path)
+    submitted = {cid for batch in state['batches'] for cid in batch['custom_ids']}
+    pending = [r for r in requirements if r['custom_id'] not in submitted]
+
+    for start in range(0, len(pending), batch_size):
+        chunk = pending[start:start + batch_size]
+        requests = []
+        for item in chunk:
+            params = build_request_params(
+                build_protocol_message(item['requirement'], item['project_context']),
+                max_tokens=max_tokens
+            )
+            params.pop('betas')
+            requests.append({'custom_id': item['custom_id'], 'params': params})
+
+        batch_state = {
+            'id': None,
+            'custom_ids': [item['custom_id'] for item in chunk],
+            'status': 'submitting',
+            'submitted_at': time.time(),
+            'exported': False
+        }
+        state['batches'].append(batch_state)
+        save_state(state_path, state)
+
+        batch = client.beta.messages.batches.create(requests=requests, betas=PROTOCOL_BETAS)
+        batch_state['id'] = batch.id
+        batch_state['status'] = batch.processing_status
+        save_state(state_path, state)
+        print(f"📦 Submitted batch {batch.id} ({len(chunk)} requests)")
+
+def wait_for_batch(client, batch_id, initial_delay=5.0, max_delay=60.0):
+    """
+    Polls a batch with exponential backoff until it ends
+
+    Args:
+        client: Anthropic client
+        batch_id: Batch ID
+        initial_delay: First polling interval in seconds
+        max_delay: Maximum polling interval in seconds
+
+    Returns:
+        Final batch object
+    """
+    delay = initial_delay
+    while True:
+        batch = client.beta.messages.batches.retrieve(batch_id, betas=PROTOCOL_BETAS)
+        if batch.processing_status == 'ended':
+            return batch
+        counts = batch.request_counts
+        print(f"⏳ {batch_id}: {counts.processing} processing, {counts.succeeded} succeeded")
+        time.sleep(delay)
+        delay = min(max_delay, delay * 1.5)
+
+def result_record(entry):
+    """
+    Converts a batch result entry into a JSONL record
+
+    Args:
+        entry: Batch result entry
+
+    Returns:
+        dict with custom_id, status and text/usage or error
+    """
+    record = {'custom_id': entry.custom_id, 'status': entry.result.type}
+    if entry.result.type == 'succeeded':
+        message = entry.result.message
+        record['text'] = "\n".join(c.text for c in message.content if c.type == 'text')
+        record['usage'] = {
+            'input_tokens': message.usage.input_tokens,
+            'output_tokens': message.usage.output_tokens
+        }
+    elif entry.result.type == 'errored':
+        record['error'] = str(entry.result.error)
+    return record
+
+def export_results(client, batch_state, output_path, already_exported):
+    """
+    Streams the results of an ended batch to the output JSONL file
+
+    Args:
+        client: Anthropic client
+        batch_state: Batch entry from the pipeline state
+        output_path: JSONL results file (appended to)
+        already_exported: Set of custom_ids already in the output file
+
+    Returns:
+        int with the number of records written
+    """
+    written = 0
+    with open(output_path, 'a', encoding='utf-8') as out:
+        for entry in client.beta.messages.batches.results(batch_state['id'], betas=PROTOCOL_BETAS):
+            if entry.custom_id in already_exported:
+                continue
+            out.write(json.dumps(result_record(entry)) + "\n")
+            out.flush()
+            already_exported.add(entry.custom_id)
+            written += 1
+    return written
+
+def run_pipeline(client, input_path, output_path, state_path=None, batch_size=MAX_BATCH_REQUESTS,
+                 poll_interval=5.0):
+    """
+    Runs (or resumes) a complete batch pipeline
+
+    Args:
+        client: Anthropic client
+        input_path: File with requirements
+        output_path: JSONL results file
+        state_path: State file (defaults to <output_path>.state.json)
+        batch_size: Maximum requests per batch
+        poll_interval: First polling interval in seconds
+
+    Returns:
+        dict with the final state
+    """
+    state_path = state_path or f"{output_path}.state.json"
+    requirements = load_requirements(input_path)
+    state = load_state(state_path)
+
+    submit_pending(client, requirements, state, state_path, batch_size=batch_size)
+
+    truncate_partial_line(output_path)
+    already_exported = exported_ids(output_path)
+    for batch_state in state['batches']:
+        if batch_state['exported']:
+            continue
+        batch = wait_for_batch(client, batch_state['id'], initial_delay=poll_interval)
+        batch_state['status'] = batch.processing_status
+        written = export_results(client, batch_state, output_path, already_exported)
+        batch_state['exported'] = True
+        save_state(state_path, state)
+        print(f"✅ Batch {batch_state['id']}: {written} results written to {output_path}")
+
+    return state
+
+def main():
+    parser = argparse.ArgumentParser(description="Run development requests through Message Batches")
+    parser.add_argument("input", help="Requirements file (text or JSONL)")
+    parser.add_argument("output", help="JSONL results file")
+    parser.add_argument("--state", help="State file (default: <output>.state.json)")
+    parser.add_argument("--batch-size", type=int, default=MAX_BATCH_REQUESTS)
+    parser.add_argument("--poll-interval", type=float, default=5.0)
+    parser.add_argument("--fake", action="store_true",
+                        help="Run against an in-process fake server")
+    args = parser.parse_args()
+
+    from anthropic import Anthropic
+
+    server = None
+    if args.fake:
+        from fake_anthropic_server import FakeAnthropicServer
+
+        server = FakeAnthropicServer(latency=0).start()
+        client = Anthropic(api_key="fake-key", base_url=server.url)
+        args.poll_interval = min(args.poll_interval, 0.1)
+    else:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        if not os.getenv("ANTHROPIC_API_KEY"):
+            raise ValueError("ANTHROPIC_API_KEY not found. Configure your .env file.")
+        client = Anthropic()
+
+    try:
+        run_pipeline(client, args.input, args.output, state_path=args.state,
+                     batch_size=args.batch_size, poll_interval=args.poll_interval)
+    finally:
+        if server:
+            server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,56 +5,96 @@ This example demonstrates how to use all skills together to develop
 a complete functionality following the established protocol.
 """
 
-from anthropic import Anthropic
 import os
-from dotenv import load_dotenv
 from pathlib import Path
-import json
+import sys
 
-# Load environment variables
-load_dotenv()
+# Reuse the codebase_understanding skill scripts and the security checks tooling
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "skills" / "codebase_understanding" / "scripts"))
+sys.path.insert(0, str(ROOT_DIR / "security_checks" / "scripts"))
 
-API_KEY = os.getenv("ANTHROPIC_API_KEY")
-MODEL = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5")
+from catalog_index import catalog_stat
+from check_selector import format_checks_context, select_applicable_checks
+from context_builder import DEFAULT_CONTEXT_TOKENS, get_project_context as build_project_context, project_fingerprint
+from instrumentation import format_summary, instrument, record_stream
+from protocol_request import build_protocol_message, build_request_params
+from stream_renderer import stream_message
 
-if not API_KEY:
-    raise ValueError("ANTHROPIC_API_KEY not found. Configure your .env file.")
+_client = None
+_security_checks_cache = {}
 
-# Initialize client
-client = Anthropic(api_key=API_KEY)
+def get_client():
+    """
+    Creates the API client on first use
+    
+    The SDK and python-dotenv are imported here, so importing this module
+    for the local helpers (e.g. get_project_context) stays fast.
+    
+    Returns:
+        Instrumented Anthropic client (API calls are recorded in instrumentation.METRICS)
+    """
+    global _client
+    if _client is None:
+        from anthropic import Anthropic
+        from dotenv import load_dotenv
+        
+        # Load environment variables
+        load_dotenv()
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not found. Configure your .env file.")
+        _client = instrument(Anthropic(api_key=api_key))
+    return _client
 
-def get_project_context(project_path):
+def get_security_checks_context(project_path):
     """
-    Gets project context to include in prompt
+    Lists the CRITICAL/HIGH security checks that apply to a project
+    
+    Memoized with the same fingerprint as the project context (plus the
+    catalogue documents), so the stack is not detected again on every call.
     
     Args:
         project_path: Project path
         
     Returns:
-        str with project context
+        str with one line per check
     """
-    context_parts = []
-    
-    # Basic information
-    context_parts.append(f"Project path: {project_path}")
+    key = str(Path(project_path).resolve())
+    fingerprint = (project_fingerprint(key), catalog_stat())
+    cached = _security_checks_cache.get(key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
     
-    # Check package.json (React/Node)
-    package_json = Path(project_path) / "package.json"
-    if package_json.exists():
-        with open(package_json) as f:
-            data = json.load(f)
-            context_parts.append(f"Name: {data.get('name', 'N/A')}")
-            context_parts.append(f"Main dependencies: {', '.join(list(data.get('dependencies', {}).keys())[:5])}")
+    security_checks = format_checks_context(select_applicable_checks(key))
+    _security_checks_cache[key] = (fingerprint, security_checks)
+    return security_checks
+
+def get_project_context(project_path, max_tokens=DEFAULT_CONTEXT_TOKENS):
+    """
+    Gets project context to include in prompt
     
-    # Check directory structure
-    src_path = Path(project_path) / "src"
-    if src_path.exists():
-        dirs = [d.name for d in src_path.iterdir() if d.is_dir()]
-        context_parts.append(f"Directories in src/: {', '.join(dirs[:5])}")
+    Delegates to the codebase_understanding context builder, which caches
+    the analysis per project and keeps it within a token budget. Only the
+    security checks that apply to the project's stack are listed.
     
-    return "\n".join(context_parts)
+    Args:
+        project_path: Project path
+        max_tokens: Maximum estimated tokens of the context
+        
+    Returns:
+        str with project context
+    """
+    security_checks = get_security_checks_context(project_path)
+    extra_sections = [{
+        'title': 'Security checks',
+        'priority': 4,
+        'content': f"Applicable security checks (CRITICAL/HIGH):\n{security_checks}"
+    }] if security_checks else []
+    return build_project_context(project_path, max_tokens=max_tokens, extra_sections=extra_sections)
 
-def develop_with_protocol(user_requirement, project_path=None, verbose=True):
+def develop_with_protocol(user_requirement, project_path=None, verbose=True, stream=False,
+                          prompt_name=None):
     """
     Develops a functionality following the complete protocol
     
@@ -62,6 +102,8 @@ def develop_with_protocol(user_requirement, project_path=None, verbose=True):
         user_requirement: User requirement
         project_path: Optional project path
         verbose: If True, prints detailed information
+        stream: If True, renders the response incrementally as it arrives
+        prompt_name: Optional name used to label the request metrics
         
     Returns:
         Claude response
@@ -72,102 +114,55 @@ def develop_with_protocol(user_requirement, project_path=None, verbose=True):
         print("=" * 80)
         print(f"\n📋 Requirement: {user_requirement}\n")
     
-    # Build context
-    context = ""
-    if project_path:
-        project_context = get_project_context(project_path)
-        context = f"""
-        
-PROJECT CONTEXT:
-{project_context}
-
-IMPORTANT: Before implementing, completely analyze the current project state.
-"""
-    
     # Build message following protocol
-    message = f"""
-{user_requirement}
-{context}
-
-Please follow the complete development protocol:
-
-1. REQUIREMENTS ANALYSIS (requirements_analyzer):
-   - Identify the main requirement
-   - List all necessary functionalities
-   - Identify constraints and dependencies
-   - Define acceptance criteria
-
-2. CODEBASE UNDERSTANDING (codebase_understanding):
-   - Analyze the project structure
-   - Identify technologies and frameworks used
-   - Recognize patterns and conventions
-   - Locate relevant existing code
-
-3. PLANNING (project_protocol):
-   - Create a coherent implementation plan
-   - Design solution respecting existing architecture
-   - Identify components to create/modify
-   - Plan integration
-
-4. IMPLEMENTATION (implementation_protocol):
-   - Implement following project conventions
-   - Maintain consistency with existing code
-   - Document important decisions
-   - Validate that it meets requirements
-
-Please provide:
-- Complete requirements analysis
-- Current project state analysis
-- Detailed implementation plan
-- Implemented code following standards
-"""
+    project_context = get_project_context(project_path) if project_path else None
+    message = build_protocol_message(user_requirement, project_context)
+    params = build_request_params(message, max_tokens=8192)  # More tokens for complete responses
     
     if verbose:
         print("🔄 Sending request to Claude with all skills...\n")
     
-    # Load all template skills
-    response = client.beta.messages.create(
-        model=MODEL,
-        max_tokens=8192,  # More tokens for complete responses
-        container={
-            "skills": [
-                {"type": "custom", "skill_id": "project_protocol", "version": "latest"},
-                {"type": "custom", "skill_id": "requirements_analyzer", "version": "latest"},
-                {"type": "custom", "skill_id": "codebase_understanding", "version": "latest"},
-                {"type": "custom", "skill_id": "implementation_protocol", "version": "latest"}
-            ]
-        },
-        tools=[{"type": "code_execution_20250825", "name": "code_execution"}],
-        messages=[{"role": "user", "content": message}],
-        betas=[
-            "code-execution-2025-08-25",
-            "files-api-2025-04-14",
-            "skills-2025-10-02"
-        ]
-    )
-    
-    if verbose:
-        print("✅ Response received\n")
-        print("=" * 80)
-        print("CLAUDE RESPONSE")
-        print("=" * 80)
-        print()
+    if stream:
+        if verbose:
+            print("=" * 80)
+            print("CLAUDE RESPONSE (streaming)")
+            print("=" * 80)
+            print()
         
-        for content in response.content:
-            if content.type == "text":
-                print(content.text)
-                print()
-            elif content.type == "tool_use":
-                print(f"🔧 Tool used: {content.name}")
-                if hasattr(content, 'input'):
-                    print(f"   Input: {str(content.input)[:200]}...")
-                print()
+        # Render text and tool blocks as they arrive
+        response, metrics = stream_message(get_client(), params, render=verbose)
+        record_stream(params, response, metrics, prompt_name=prompt_name)
+    else:
+        # Load all template skills
+        response = get_client().beta.messages.create(**params, prompt_name=prompt_name)
+        metrics = None
         
+        if verbose:
+            print("✅ Response received\n")
+            print("=" * 80)
+            print("CLAUDE RESPONSE")
+            print("=" * 80)
+            print()
+            
+            for content in response.content:
+                if content.type == "text":
+                    print(content.text)
+                    print()
+                elif content.type == "tool_use":
+                    print(f"🔧 Tool used: {content.name}")
+                    if hasattr(content, 'input'):
+                        print(f"   Input: {str(content.input)[:200]}...")
+                    print()
+    
+    if verbose:
         print("=" * 80)
         print(f"📊 Token Usage:")
         print(f"   Input: {response.usage.input_tokens:,}")
         print(f"   Output: {response.usage.output_tokens:,}")
         print(f"   Total: {response.usage.input_tokens + response.usage.output_tokens:,}")
+        if metrics:
+            print(f"⏱️  Time to first token: {metrics['ttft']:.2f}s")
+            print(f"⚡ Speed: {metrics['tokens_per_second']:.1f} tokens/s")
         print("=" * 80)
     
     return response
@@ -183,7 +178,8 @@ def example_simple_feature():
     response = develop_with_protocol(
         requirement,
         project_path=Path.cwd().parent,  # Adjust according to your project
-        verbose=True
+        verbose=True,
+        prompt_name="simple_feature"
     )
     
     return response
@@ -207,7 +203,8 @@ def example_complex_feature():
     response = develop_with_protocol(
         requirement,
         project_path=Path.cwd().parent,  # Adjust according to your project
-        verbose=True
+        verbose=True,
+        prompt_name="complex_feature"
     )
     
     return response
@@ -230,7 +227,8 @@ def example_refactoring():
     response = develop_with_protocol(
         requirement,
         project_path=Path.cwd().parent,  # Adjust according to your project
-        verbose=True
+        verbose=True,
+        prompt_name="refactoring"
     )
     
     return response
@@ -256,8 +254,12 @@ if __name__ == "__main__":
         develop_with_protocol(
             custom_requirement,
             project_path=Path.cwd().parent,
-            verbose=True
+            verbose=True,
+            stream=True
         )
     else:
         print("\nUsing default example...\n")
         example_simple_feature()
+    
+    print("\n📈 API Metrics:")
+    print(format_summary())
@@ -0,0 +1,434 @@
+"""
+Fake Anthropic Server - In-process stand-in for the Messages API
+
+Serves /v1/messages (plain and streaming), the Message Batches
+endpoints (create, list, retrieve, results) and a minimal Skills API (create skills and versions from
+multipart uploads, retrieve them).
+
+Runs a local HTTP server in a background thread so the examples can be
+exercised (and their throughput measured) offline, through the real SDK:
+
+    server = FakeAnthropicServer(latency=0.05, failure_rate=0.1).start()
+    client = AsyncAnthropic(api_key="fake-key", base_url=server.url)
+    ...
+    server.stop()
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ERROR_TYPES = {
+    429: "rate_limit_error",
+    529: "overloaded_error"
+}
+
+class FakeAnthropicServer:
+    """
+    Minimal Messages API server with configurable latency and failures
+
+    Args:
+        latency: Seconds each request takes before answering
+        failure_rate: Probability (0-1) of answering with a retryable error
+        failure_status: HTTP status used for injected failures (429 or 529)
+        output_tokens: Output tokens reported in usage
+        response_text: Text of every answer (streamed word by word)
+        tool_input: Input of a code_execution tool_use block sent before the
+            text (streamed in input_json_delta fragments), None for no block
+        batch_duration: Seconds a message batch stays in progress
+        seed: Seed for the failure injection
+    """
+
+    def __init__(self, latency=0.05, failure_rate=0.0, failure_status=429,
+                 output_tokens=256, response_text="OK", tool_input=None, batch_duration=0.2, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.output_tokens = output_tokens
+        self.response_text = response_text
+        self.tool_input = tool_input
+        self.batch_duration = batch_duration
+        self.batches = {}
+        self.skills = {}
+        self.stats = {'requests': 0, 'failures': 0, 'skill_uploads': 0}
+        # time.monotonic() of every Messages request, to check client rate limits
+        self.arrivals = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Starts the server on a free local port"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                data = self.rfile.read(length)
+                content_type = self.headers.get("Content-Type", "")
+                if content_type.startswith("multipart/form-data"):
+                    body = parse_multipart(content_type, data)
+                else:
+                    body = json.loads(data or b"{}")
+                server.handle(self, self.path.split("?")[0], body)
+
+            def do_GET(self):
+                server.handle(self, self.path.split("?")[0], None)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def handle(self, handler, path, body):
+        """
+        Dispatches a request to the matching endpoint
+
+        Args:
+            handler: BaseHTTPRequestHandler for the connection
+            path: Request path without query string
+            body: Decoded JSON body (None for GET)
+        """
+        if path.startswith("/v1/messages/batches"):
+            return self.handle_batches(handler, path, body)
+        if path.startswith("/v1/skills"):
+            return self.handle_skills(handler, path, body)
+
+        with self._lock:
+            self.stats['requests'] += 1
+            self.arrivals.append(time.monotonic())
+            fail = self._random.random() < self.failure_rate
+            if fail:
+                self.stats['failures'] += 1
+
+        time.sleep(self.latency)
+
+        if fail:
+            self.send_json(handler, self.failure_status, {
+                "type": "error",
+                "error": {"type": ERROR_TYPES.get(self.failure_status, "api_error"),
+                          "message": "Injected failure"}
+            }, headers={"retry-after": "0"})
+        elif path == "/v1/messages" and body is not None and body.get("stream"):
+            self.send_stream(handler, self.build_message(body))
+        elif path == "/v1/messages" and body is not None:
+            self.send_json(handler, 200, self.build_message(body))
+        else:
+            self.send_not_found(handler, path)
+
+    def handle_batches(self, handler, path, body):
+        """
+        Serves the Message Batches endpoints (create, list, retrieve, results)
+
+        Batches end batch_duration seconds after being created.
+
+        Args:
+            handler: BaseHTTPRequestHandler for the connection
+            path: Request path without query string
+            body: Decoded JSON body (None for GET)
+        """
+        parts = path.rstrip("/").split("/")[4:]
+        if not parts and body is not None:
+            results = [{
+                "custom_id": request["custom_id"],
+                "result": {"type": "succeeded", "message": self.build_message(request["params"])}
+            } for request in body.get("requests", [])]
+            with self._lock:
+                batch_id = f"msgbatch_fake_{len(self.batches) + 1:06d}"
+                self.batches[batch_id] = {'created': time.time(), 'results': results}
+            return self.send_json(handler, 200, self.batch_object(batch_id))
+
+        if not parts:
+            # Newest first, in a single page
+            data = [self.batch_object(batch_id) for batch_id in reversed(list(self.batches))]
+            return self.send_json(handler, 200, {
+                "data": data,
+                "has_more": False,
+                "first_id": data[0]["id"] if data else None,
+                "last_id": data[-1]["id"] if data else None
+            })
+
+        batch_id = parts[0]
+        if batch_id not in self.batches:
+            return self.send_not_found(handler, path)
+        if len(parts) == 1:
+            return self.send_json(handler, 200, self.batch_object(batch_id))
+        if parts[1:] == ["results"] and self.batch_ended(batch_id):
+            data = "".join(json.dumps(r) + "\n" for r in self.batches[batch_id]['results']).encode()
+            handler.send_response(200)
+            handler.send_header("Content-Type", "application/x-jsonl")
+            handler.send_header("Content-Length", str(len(data)))
+            handler.end_headers()
+            handler.wfile.write(data)
+            return None
+        return self.send_not_found(handler, path)
+
+    def handle_skills(self, handler, path, body):
+        """
+        Serves the Skills endpoints (create skill, create version, retrieve both)
+
+        Uploads take `latency` seconds and must contain SKILL.md inside one
+        top-level directory, which has to stay the same across versions.
+
+        Args:
+            handler: BaseHTTPRequestHandler for the connection
+            path: Request path without query string
+            body: Decoded multipart body (None for GET)
+        """
+        parts = path.rstrip("/").split("/")[3:]
+        skill_id = parts[0] if parts else None
+        if skill_id is not None and skill_id not in self.skills:
+            return self.send_not_found(handler, path)
+
+        if body is not None and (not parts or parts[1:] == ["versions"]):
+            time.sleep(self.latency)
+            files = body.get("files", [])
+            directories = {name.split("/", 1)[0] for name, _ in files}
+            names = {name for name, _ in files}
+            if len(directories) != 1 or f"{next(iter(directories))}/SKILL.md" not in names:
+                return self.send_error(handler, 400, "invalid_request_error",
+                                       "Upload must contain SKILL.md in a single top-level directory")
+            directory = directories.pop()
+            if skill_id and self.skills[skill_id]['name'] != directory:
+                return self.send_error(handler, 400, "invalid_request_error",
+                                       f"Skill directory must stay {self.skills[skill_id]['name']}")
+
+            with self._lock:
+                self.stats['skill_uploads'] += 1
+                if skill_id is None:
+                    skill_id = f"skill_fake_{len(self.skills) + 1:06d}"
+                    self.skills[skill_id] = {
+                        'name': directory,
+                        'display_name': body.get("fields", {}).get("display_name") or directory,
+                        'created': time.time(),
+                        'versions': []
+                    }
+                skill = self.skills[skill_id]
+                skill['versions'].append({
+                    'id': f"skillver_fake_{self.stats['skill_uploads']:06d}",
+                    'created': time.time(),
+                    'files': {name: hashlib.sha256(data).hexdigest() for name, data in files}
+                })
+            if parts:
+                return self.send_json(handler, 200, self.skill_version_object(skill_id, skill['versions'][-1]))
+            return self.send_json(handler, 200, self.skill_object(skill_id))
+
+        if len(parts) == 1:
+            return self.send_json(handler, 200, self.skill_object(skill_id))
+        if len(parts) == 3 and parts[1] == "versions":
+            for version in self.skills[skill_id]['versions']:
+                if version['id'] == parts[2]:
+                    return self.send_json(handler, 200, self.skill_version_object(skill_id, version))
+        return self.send_not_found(handler, path)
+
+    def skill_object(self, skill_id):
+        """Builds the Skill object of a fake skill"""
+        skill = self.skills[skill_id]
+        return {
+            "id": skill_id,
+            "type": "skill",
+            "display_name": skill['display_name'],
+            "latest_version_id": skill['versions'][-1]['id'],
+            "source": "custom",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(skill['created'])),
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(skill['versions'][-1]['created']))
+        }
+
+    def skill_version_object(self, skill_id, version):
+        """Builds the SkillVersion object of a fake skill version"""
+        return {
+            "id": version['id'],
+            "type": "skill_version",
+            "skill_id": skill_id,
+            "name": self.skills[skill_id]['name'],
+            "description": "",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(version['created']))
+        }
+
+    def batch_ended(self, batch_id):
+        """Returns True once a batch has finished processing"""
+        return time.time() - self.batches[batch_id]['created'] >= self.batch_duration
+
+    def batch_object(self, batch_id):
+        """
+        Builds the MessageBatch object of a fake batch
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            dict with the batch
+        """
+        batch = self.batches[batch_id]
+        ended = self.batch_ended(batch_id)
+        count = len(batch['results'])
+        created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(batch['created']))
+        expires = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(batch['created'] + 86400))
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0
+            },
+            "created_at": created,
+            "expires_at": expires,
+            "ended_at": created if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+
+    def build_message(self, body):
+        """
+        Builds a Message object answering a request body
+
+        Args:
+            body: Messages API request body
+
+        Returns:
+            dict with the message
+        """
+        prompt = json.dumps(body.get("messages", []))
+        with self._lock:
+            message_id = f"msg_fake_{self.stats['requests']:06d}"
+        content = [{"type": "text", "text": self.response_text}]
+        if self.tool_input is not None:
+            content.insert(0, {"type": "tool_use", "id": f"toolu_fake_{message_id[-6:]}",
+                               "name": "code_execution", "input": self.tool_input})
+        return {
+            "id": message_id,
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake-model"),
+            "content": content,
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {
+                "input_tokens": max(1, len(prompt) // 4),
+                "output_tokens": self.output_tokens
+            }
+        }
+
+    def send_stream(self, handler, message):
+        """
+        Writes a message as a Server-Sent Events stream
+
+        Args:
+            handler: BaseHTTPRequestHandler for the connection
+            message: Message built by build_message
+        """
+        usage = message["usage"]
+        start = dict(message, content=[], stop_reason=None,
+                     usage={"input_tokens": usage["input_tokens"], "output_tokens": 1})
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Connection", "close")
+        handler.end_headers()
+        handler.close_connection = True
+
+        def emit(event, data):
+            handler.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+            handler.wfile.flush()
+
+        emit("message_start", {"type": "message_start", "message": start})
+        for index, block in enumerate(message["content"]):
+            if block["type"] == "tool_use":
+                emit("content_block_start", {"type": "content_block_start", "index": index,
+                                             "content_block": dict(block, input={})})
+                data = json.dumps(block["input"])
+                for offset in range(0, len(data), 8):
+                    emit("content_block_delta", {"type": "content_block_delta", "index": index,
+                                                 "delta": {"type": "input_json_delta",
+                                                           "partial_json": data[offset:offset + 8]}})
+            else:
+                emit("content_block_start", {"type": "content_block_start", "index": index,
+                                             "content_block": {"type": "text", "text": ""}})
+                for i, word in enumerate(block["text"].split(" ")):
+                    chunk = word if i == 0 else " " + word
+                    emit("content_block_delta", {"type": "content_block_delta", "index": index,
+                                                 "delta": {"type": "text_delta", "text": chunk}})
+            emit("content_block_stop", {"type": "content_block_stop", "index": index})
+        emit("message_delta", {"type": "message_delta",
+                               "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                               "usage": {"output_tokens": usage["output_tokens"]}})
+        emit("message_stop", {"type": "message_stop"})
+
+    @classmethod
+    def send_not_found(cls, handler, path):
+        """Writes a 404 error response"""
+        cls.send_error(handler, 404, "not_found_error", f"Unknown endpoint {path}")
+
+    @classmethod
+    def send_error(cls, handler, status, error_type, message):
+        """Writes an API error response"""
+        cls.send_json(handler, status, {"type": "error", "error": {"type": error_type, "message": message}})
+
+    @staticmethod
+    def send_json(handler, status, payload, headers=None):
+        """Writes a JSON response"""
+        data = json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+def parse_multipart(content_type, data):
+    """
+    Decodes a multipart/form-data body
+
+    Args:
+        content_type: Content-Type header (with the boundary)
+        data: Raw body
+
+    Returns:
+        dict with fields (name -> str) and files (list of (filename, bytes))
+    """
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + data)
+    fields = {}
+    files = []
+    for part in message.iter_parts():
+        payload = part.get_payload(decode=True) or b""
+        if part.get_filename() is not None:
+            files.append((part.get_filename(), payload))
+        else:
+            fields[part.get_param("name", header="content-disposition")] = payload.decode()
+    return {"fields": fields, "files": files}
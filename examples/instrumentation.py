@@ -0,0 +1,402 @@
+"""
+Instrumentation - Token usage and latency metrics for API calls
+
+Wraps an Anthropic (or AsyncAnthropic) client so every messages.create
+call records latency, input/output/cached tokens, retries and errors
+into in-memory histograms, labelled by model, skills and prompt:
+
+    client = instrument(Anthropic())
+    client.beta.messages.create(**params, prompt_name="simple_feature")
+    print(format_summary())
+
+Streamed requests are recorded with record_stream() (adds TTFT).
+Metrics can be exported locally in Prometheus text format
+(start_prometheus_server) or forwarded to OpenTelemetry when it is
+installed (enable_opentelemetry).
+"""
+
+import bisect
+import threading
+import time
+
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300]
+TOKEN_BUCKETS = [10, 100, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000]
+
+HISTOGRAMS = {
+    'anthropic_request_latency_seconds': ('Request latency', LATENCY_BUCKETS),
+    'anthropic_ttft_seconds': ('Time to first token (streaming)', LATENCY_BUCKETS),
+    'anthropic_input_tokens': ('Input tokens per request', TOKEN_BUCKETS),
+    'anthropic_output_tokens': ('Output tokens per request', TOKEN_BUCKETS),
+    'anthropic_cached_input_tokens': ('Cache read input tokens per request', TOKEN_BUCKETS)
+}
+
+COUNTERS = {
+    'anthropic_requests_total': 'Completed requests',
+    'anthropic_retries_total': 'Retries taken before requests succeeded',
+    'anthropic_errors_total': 'Failed requests'
+}
+
+class Histogram:
+    """
+    Fixed-bucket histogram
+
+    Args:
+        bounds: Sorted upper bounds of the buckets (+Inf is implicit)
+    """
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Adds a value to the histogram"""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimates a quantile as the upper bound of its bucket
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            float with the estimate (inf if it falls in the last bucket)
+        """
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds + [float('inf')], self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float('inf')
+
+class MetricsRegistry:
+    """In-memory store of histograms and counters keyed by metric and labels"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.counters = {}
+        self.listeners = []
+        self._lock = threading.Lock()
+
+    def observe(self, name, labels, value):
+        """Records a value in a histogram"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(HISTOGRAMS[name][1])
+            histogram.observe(value)
+        for listener in self.listeners:
+            listener('histogram', name, labels, value)
+
+    def increment(self, name, labels, value=1):
+        """Increments a counter"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+        for listener in self.listeners:
+            listener('counter', name, labels, value)
+
+    def record(self, labels, latency, usage, retries=0, ttft=None):
+        """
+        Records a completed request
+
+        Args:
+            labels: Dict with model, skills and prompt labels
+            latency: Seconds from request to complete response
+            usage: Usage object of the response
+            retries: Retries taken before the request succeeded
+            ttft: Time to first token (streaming only)
+        """
+        self.increment('anthropic_requests_total', labels)
+        self.increment('anthropic_retries_total', labels, retries)
+        self.observe('anthropic_request_latency_seconds', labels, latency)
+        if ttft is not None:
+            self.observe('anthropic_ttft_seconds', labels, ttft)
+        self.observe('anthropic_input_tokens', labels, usage.input_tokens)
+        self.observe('anthropic_output_tokens', labels, usage.output_tokens)
+        self.observe('anthropic_cached_input_tokens', labels,
+                     getattr(usage, 'cache_read_input_tokens', None) or 0)
+
+    def record_error(self, labels, error):
+        """Records a failed request"""
+        status = getattr(error, 'status_code', None)
+        self.increment('anthropic_errors_total',
+                       dict(labels, error=str(status) if status else type(error).__name__))
+
+    def total(self, name):
+        """
+        Sums a metric over all label sets
+
+        Args:
+            name: Histogram or counter name
+
+        Returns:
+            float with the sum of observed values (or counter increments)
+        """
+        with self._lock:
+            if name in HISTOGRAMS:
+                return sum(h.sum for (n, _), h in self.histograms.items() if n == name)
+            return sum(v for (n, _), v in self.counters.items() if n == name)
+
+    def reset(self):
+        """Clears all metrics"""
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+# Default registry shared by the examples
+METRICS = MetricsRegistry()
+
+def request_labels(params, prompt_name=None):
+    """
+    Builds the metric labels of a request
+
+    Args:
+        params: Request parameters
+        prompt_name: Optional name of the prompt
+
+    Returns:
+        dict with model, skills and prompt labels
+    """
+    skills = (params.get('container') or {}).get('skills') or []
+    return {
+        'model': params.get('model', 'unknown'),
+        'skills': '+'.join(sorted(s.get('skill_id', '?') for s in skills)) or 'none',
+        'prompt': prompt_name or 'default'
+    }
+
+def record_stream(params, message, metrics, prompt_name=None, registry=METRICS):
+    """
+    Records a streamed request measured by stream_renderer.stream_message
+
+    Args:
+        params: Request parameters
+        message: Final message
+        metrics: Streaming metrics (ttft, elapsed)
+        prompt_name: Optional name of the prompt
+        registry: Metrics registry
+    """
+    registry.record(request_labels(params, prompt_name), latency=metrics['elapsed'],
+                    usage=message.usage, ttft=metrics['ttft'])
+
+class InstrumentedMessages:
+    """Wraps a messages resource, recording metrics for each create call"""
+
+    def __init__(self, messages, registry):
+        self._messages = messages
+        self._registry = registry
+
+    def create(self, prompt_name=None, **params):
+        if params.get('stream'):
+            # Streams are measured by the consumer (see record_stream)
+            return self._messages.create(**params)
+
+        labels = request_labels(params, prompt_name)
+        started = time.perf_counter()
+        try:
+            raw = self._messages.with_raw_response.create(**params)
+        except Exception as e:
+            self._registry.record_error(labels, e)
+            raise
+        message = raw.parse()
+        self._registry.record(labels, time.perf_counter() - started, message.usage,
+                              retries=raw.retries_taken)
+        return message
+
+    def __getattr__(self, name):
+        return getattr(self._messages, name)
+
+class AsyncInstrumentedMessages(InstrumentedMessages):
+    """Async variant of InstrumentedMessages"""
+
+    async def create(self, prompt_name=None, **params):
+        if params.get('stream'):
+            return await self._messages.create(**params)
+
+        labels = request_labels(params, prompt_name)
+        started = time.perf_counter()
+        try:
+            raw = await self._messages.with_raw_response.create(**params)
+        except Exception as e:
+            self._registry.record_error(labels, e)
+            raise
+        message = await raw.parse()
+        self._registry.record(labels, time.perf_counter() - started, message.usage,
+                              retries=raw.retries_taken)
+        return message
+
+class _Namespace:
+    """Attribute proxy exposing an instrumented messages resource"""
+
+    def __init__(self, target, messages):
+        self._target = target
+        self.messages = messages
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+class InstrumentedClient:
+    """
+    Client proxy whose messages.create and beta.messages.create are instrumented
+
+    Args:
+        client: Anthropic or AsyncAnthropic client
+        registry: Metrics registry (defaults to METRICS)
+    """
+
+    def __init__(self, client, registry=None):
+        registry = registry or METRICS
+        wrapper = AsyncInstrumentedMessages if is_async_client(client) else InstrumentedMessages
+        self._client = client
+        # Callers that retry on their own record one call per logical request through it
+        self.unwrapped = client
+        self.registry = registry
+        self.messages = wrapper(client.messages, registry)
+        self.beta = _Namespace(client.beta, wrapper(client.beta.messages, registry))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+def is_async_client(client):
+    """Returns True for AsyncAnthropic clients"""
+    return type(client).__name__.startswith('Async')
+
+def instrument(client, registry=None):
+    """
+    Wraps a client so its API calls are recorded
+
+    Args:
+        client: Anthropic or AsyncAnthropic client
+        registry: Metrics registry (defaults to METRICS)
+
+    Returns:
+        InstrumentedClient
+    """
+    return InstrumentedClient(client, registry)
+
+def format_summary(registry=METRICS):
+    """
+    Formats a per-label summary of latency and token usage
+
+    Args:
+        registry: Metrics registry
+
+    Returns:
+        str with one line per metric and label set
+    """
+    lines = []
+    for (name, labels), histogram in sorted(registry.histograms.items()):
+        label_text = ", ".join(f"{k}={v}" for k, v in labels)
+        lines.append(f"{name} [{label_text}]: count={histogram.count} "
+                     f"avg={histogram.sum / histogram.count:.2f} "
+                     f"p50<={histogram.quantile(0.5)} p95<={histogram.quantile(0.95)}")
+    for (name, labels), value in sorted(registry.counters.items()):
+        label_text = ", ".join(f"{k}={v}" for k, v in labels)
+        lines.append(f"{name} [{label_text}]: {value}")
+    return "\n".join(lines)
+
+def render_prometheus(registry=METRICS):
+    """
+    Renders the metrics in Prometheus text exposition format
+
+    Args:
+        registry: Metrics registry
+
+    Returns:
+        str with the exposition
+    """
+    def label_text(labels, extra=()):
+        items = list(labels) + list(extra)
+        return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}" if items else ""
+
+    lines = []
+    with registry._lock:
+        histograms = sorted(registry.histograms.items())
+        counters = sorted(registry.counters.items())
+
+    declared = set()
+    for (name, labels), histogram in histograms:
+        if name not in declared:
+            lines.append(f"# HELP {name} {HISTOGRAMS[name][0]}")
+            lines.append(f"# TYPE {name} histogram")
+            declared.add(name)
+        cumulative = 0
+        for bound, count in zip(histogram.bounds + ['+Inf'], histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{label_text(labels, [('le', bound)])} {cumulative}")
+        lines.append(f"{name}_sum{label_text(labels)} {histogram.sum}")
+        lines.append(f"{name}_count{label_text(labels)} {histogram.count}")
+
+    for (name, labels), value in counters:
+        if name not in declared:
+            lines.append(f"# HELP {name} {COUNTERS[name]}")
+            lines.append(f"# TYPE {name} counter")
+            declared.add(name)
+        lines.append(f"{name}{label_text(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+def start_prometheus_server(port=9464, registry=METRICS):
+    """
+    Serves /metrics on localhost in a background thread
+
+    Args:
+        port: Local port
+        registry: Metrics registry
+
+    Returns:
+        ThreadingHTTPServer (call shutdown() to stop it)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            data = render_prometheus(registry).encode()
+            self.send_response(200 if self.path == '/metrics' else 404)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+def enable_opentelemetry(registry=METRICS, meter_name='claude_skills_template'):
+    """
+    Forwards every recorded metric to OpenTelemetry instruments
+
+    Requires the opentelemetry-api package and a configured MeterProvider.
+
+    Args:
+        registry: Metrics registry
+        meter_name: Name of the OpenTelemetry meter
+    """
+    try:
+        from opentelemetry import metrics
+    except ImportError:
+        raise ImportError("opentelemetry-api not installed - Run: pip install opentelemetry-api")
+
+    meter = metrics.get_meter(meter_name)
+    instruments = {name: meter.create_histogram(name, description=help_text)
+                   for name, (help_text, _) in HISTOGRAMS.items()}
+    instruments.update({name: meter.create_counter(name, description=help_text)
+                        for name, help_text in COUNTERS.items()})
+
+    def listener(kind, name, labels, value):
+        if kind == 'histogram':
+            instruments[name].record(value, attributes=labels)
+        else:
+            instruments[name].add(value, attributes=labels)
+
+    registry.listeners.append(listener)
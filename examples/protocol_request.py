@@ -0,0 +1,155 @@
+"""
+Protocol Request - Shared pieces of a development request with all template skills
+
+Used by the examples so every runner (sync, async, batch...) sends exactly
+the same skills, tools, betas and prompt. Skills uploaded with skill_sync.py
+are pinned to the exact version recorded in the skills manifest.
+"""
+
+import json
+import os
+
+# ANTHROPIC_MODEL is read per request: the runners call load_dotenv() after importing this module
+DEFAULT_MODEL = "claude-sonnet-4-5"
+
+PROTOCOL_SKILLS = [
+    {"type": "custom", "skill_id": "project_protocol", "version": "latest"},
+    {"type": "custom", "skill_id": "requirements_analyzer", "version": "latest"},
+    {"type": "custom", "skill_id": "codebase_understanding", "version": "latest"},
+    {"type": "custom", "skill_id": "implementation_protocol", "version": "latest"}
+]
+
+# Written by skill_sync.py: skill directory name -> uploaded skill_id and version.
+# Overridden by SKILLS_MANIFEST, read per call like ANTHROPIC_MODEL
+DEFAULT_SKILLS_MANIFEST_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".skill-versions.json"
+)
+
+_manifest_cache = {}
+
+PROTOCOL_TOOLS = [{"type": "code_execution_20250825", "name": "code_execution"}]
+
+PROTOCOL_BETAS = [
+    "code-execution-2025-08-25",
+    "files-api-2025-04-14",
+    "skills-2025-10-02"
+]
+
+def build_protocol_message(user_requirement, project_context=None):
+    """
+    Builds the user message that asks Claude to follow the complete protocol
+
+    Args:
+        user_requirement: User requirement
+        project_context: Optional project context text
+
+    Returns:
+        str with the message content
+    """
+    context = ""
+    if project_context:
+        context = f"""
+
+PROJECT CONTEXT:
+{project_context}
+
+IMPORTANT: Before implementing, completely analyze the current project state.
+"""
+
+    return f"""
+{user_requirement}
+{context}
+
+Please follow the complete development protocol:
+
+1. REQUIREMENTS ANALYSIS (requirements_analyzer):
+   - Identify the main requirement
+   - List all necessary functionalities
+   - Identify constraints and dependencies
+   - Define acceptance criteria
+
+2. CODEBASE UNDERSTANDING (codebase_understanding):
+   - Analyze the project structure
+   - Identify technologies and frameworks used
+   - Recognize patterns and conventions
+   - Locate relevant existing code
+
+3. PLANNING (project_protocol):
+   - Create a coherent implementation plan
+   - Design solution respecting existing architecture
+   - Identify components to create/modify
+   - Plan integration
+
+4. IMPLEMENTATION (implementation_protocol):
+   - Implement following project conventions
+   - Maintain consistency with existing code
+   - Document important decisions
+   - Validate that it meets requirements
+
+Please provide:
+- Complete requirements analysis
+- Current project state analysis
+- Detailed implementation plan
+- Implemented code following standards
+"""
+
+def skills_manifest_path():
+    """Returns the skills manifest path (SKILLS_MANIFEST or the default)"""
+    return os.getenv("SKILLS_MANIFEST", DEFAULT_SKILLS_MANIFEST_PATH)
+
+def pinned_skills(manifest_path=None):
+    """
+    Returns the protocol skills pinned to their uploaded versions
+
+    Skills missing from the manifest (or without a manifest) keep their
+    configured id and "latest". The manifest is re-read only when it changes.
+
+    Args:
+        manifest_path: Skills manifest (defaults to skills_manifest_path())
+
+    Returns:
+        list of skill dicts for the container
+    """
+    manifest_path = manifest_path or skills_manifest_path()
+    try:
+        mtime = os.stat(manifest_path).st_mtime_ns
+    except OSError:
+        return PROTOCOL_SKILLS
+
+    cached = _manifest_cache.get(manifest_path)
+    if not cached or cached[0] != mtime:
+        try:
+            with open(manifest_path, encoding='utf-8') as f:
+                uploaded = json.load(f).get('skills', {})
+        except (OSError, ValueError):
+            uploaded = {}
+        cached = _manifest_cache[manifest_path] = (mtime, uploaded)
+
+    uploaded = cached[1]
+    return [
+        {"type": "custom", "skill_id": uploaded[skill["skill_id"]]["skill_id"],
+         "version": uploaded[skill["skill_id"]]["version"]}
+        if skill["skill_id"] in uploaded else skill
+        for skill in PROTOCOL_SKILLS
+    ]
+
+def build_request_params(message, max_tokens=8192, skills=None):
+    """
+    Builds the keyword arguments for client.beta.messages.create
+
+    Args:
+        message: User message content
+        max_tokens: Maximum tokens in the response
+        skills: Optional list of skills (defaults to all template skills, pinned)
+
+    Returns:
+        dict with request parameters
+    """
+    return {
+        "model": os.getenv("ANTHROPIC_MODEL", DEFAULT_MODEL),
+        "max_tokens": max_tokens,
+        "container": {"skills": skills or pinned_skills()},
+        "tools": PROTOCOL_TOOLS,
+        "messages": [{"role": "user", "content": message}],
+        "betas": PROTOCOL_BETAS
+    }
@@ -0,0 +1,333 @@
+"""
+Skill Sync - Uploads only the skills whose files changed
+
+Every skills/<name>/ directory is hashed Merkle-style: each file is hashed
+(SHA-256), each directory hash covers its sorted entries and the root hash
+covers the whole skill. Root hashes are compared against the manifest of
+uploaded versions (.skill-versions.json); new skills are created, changed
+skills get a new version, unchanged ones are skipped. Uploads run in
+parallel and the manifest records the exact version returned by the API,
+which protocol_request.pinned_skills() uses instead of "latest".
+
+Usage:
+    python skill_sync.py --dry-run        # show what would be uploaded
+    python skill_sync.py [--workers 4]
+    python skill_sync.py --fake           # against the in-process fake server
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from protocol_request import pinned_skills, skills_manifest_path
+
+SKILLS_ROOT = Path(__file__).resolve().parent.parent / "skills"
+SKILLS_BETA = "skills-2025-10-02"
+MANIFEST_VERSION = 1
+
+IGNORED_NAMES = {"__pycache__", ".DS_Store", ".pytest_cache"}
+IGNORED_SUFFIXES = (".pyc", ".pyo")
+
+def hash_file(path):
+    """
+    Hashes the content of a file
+
+    Args:
+        path: File path
+
+    Returns:
+        str with the SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def skill_files(skill_dir):
+    """
+    Lists the files of a skill that are uploaded
+
+    Args:
+        skill_dir: Skill directory
+
+    Returns:
+        sorted list of relative POSIX paths
+    """
+    files = []
+    for current, dirs, names in os.walk(skill_dir):
+        dirs[:] = [d for d in dirs if d not in IGNORED_NAMES]
+        for name in names:
+            if name not in IGNORED_NAMES and not name.endswith(IGNORED_SUFFIXES):
+                files.append(Path(current, name).relative_to(skill_dir).as_posix())
+    return sorted(files)
+
+def tree_hash(file_hashes):
+    """
+    Computes the Merkle root of a set of file hashes
+
+    Each directory node hashes the sorted "<kind> <name> <hash>" lines of
+    its entries, so any change to a file changes every hash up to the root.
+
+    Args:
+        file_hashes: Dict of relative POSIX paths to file hashes
+
+    Returns:
+        str with the root hash
+    """
+    tree = {}
+    for path, file_hash in file_hashes.items():
+        node = tree
+        *directories, name = path.split("/")
+        for directory in directories:
+            node = node.setdefault(directory, {})
+        node[name] = file_hash
+
+    def node_hash(node):
+        lines = []
+        for name in sorted(node):
+            entry = node[name]
+            if isinstance(entry, dict):
+                lines.append(f"tree {name} {node_hash(entry)}")
+            else:
+                lines.append(f"blob {name} {entry}")
+        return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+    return node_hash(tree)
+
+def hash_skill(skill_dir):
+    """
+    Hashes a skill directory
+
+    Args:
+        skill_dir: Skill directory
+
+    Returns:
+        dict with root (Merkle root) and files (path -> hash)
+    """
+    files = {path: hash_file(Path(skill_dir, path)) for path in skill_files(skill_dir)}
+    return {"root": tree_hash(files), "files": files}
+
+def discover_skills(skills_root=SKILLS_ROOT):
+    """
+    Finds the skill directories (those with a SKILL.md)
+
+    Args:
+        skills_root: Directory containing the skills
+
+    Returns:
+        dict of skill names to directories
+    """
+    return {path.parent.name: path.parent for path in sorted(Path(skills_root).glob("*/SKILL.md"))}
+
+def load_manifest(manifest_path):
+    """
+    Loads the manifest of uploaded skill versions
+
+    Args:
+        manifest_path: Path of the manifest
+
+    Returns:
+        dict with version and skills (name -> skill_id, version, root, files)
+    """
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "skills": {}}
+
+def save_manifest(manifest_path, manifest):
+    """
+    Saves the manifest atomically
+
+    Args:
+        manifest_path: Path of the manifest
+        manifest: Dict with the manifest
+    """
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def plan_sync(skills, manifest):
+    """
+    Compares the skills on disk with the manifest
+
+    Args:
+        skills: Dict of skill names to directories
+        manifest: Manifest of uploaded versions
+
+    Returns:
+        list of dicts with name, path, hashes, action (create, update or
+        unchanged) and changed (files added, modified or removed)
+    """
+    plan = []
+    for name, path in skills.items():
+        hashes = hash_skill(path)
+        entry = manifest["skills"].get(name)
+        if entry is None:
+            action, changed = "create", sorted(hashes["files"])
+        elif entry["root"] == hashes["root"]:
+            action, changed = "unchanged", []
+        else:
+            old, new = entry.get("files", {}), hashes["files"]
+            action = "update"
+            changed = sorted(p for p in set(old) | set(new) if old.get(p) != new.get(p))
+        plan.append({"name": name, "path": path, "hashes": hashes, "action": action, "changed": changed})
+    return plan
+
+def upload_skill(client, item, entry=None):
+    """
+    Uploads one skill (a new skill, or a new version of an uploaded one)
+
+    Args:
+        client: Anthropic client
+        item: Plan item of the skill
+        entry: Manifest entry of the uploaded skill, if any
+
+    Returns:
+        dict with the new manifest entry
+    """
+    files = [(f"{item['name']}/{path}", Path(item["path"], path).read_bytes())
+             for path in sorted(item["hashes"]["files"])]
+    if entry:
+        version = client.beta.skills.versions.create(entry["skill_id"], files=files, betas=[SKILLS_BETA])
+        skill_id, version_id = entry["skill_id"], version.id
+    else:
+        skill = client.beta.skills.create(files=files, display_name=item["name"], betas=[SKILLS_BETA])
+        skill_id, version_id = skill.id, skill.latest_version_id
+    return {
+        "skill_id": skill_id,
+        "version": version_id,
+        "root": item["hashes"]["root"],
+        "files": item["hashes"]["files"],
+        "uploaded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    }
+
+def sync_skills(client, skills_root=SKILLS_ROOT, manifest_path=None,
+                workers=4, dry_run=False, names=None):
+    """
+    Uploads the new and changed skills in parallel
+
+    The manifest is saved after every successful upload, so an interrupted
+    sync only re-uploads the skills that did not finish.
+
+    Args:
+        client: Anthropic client (unused with dry_run)
+        skills_root: Directory containing the skills
+        manifest_path: Path of the manifest (defaults to skills_manifest_path())
+        workers: Number of parallel uploads
+        dry_run: If True, only computes the plan
+        names: Optional skill names to sync (defaults to all)
+
+    Returns:
+        list of plan items, with entry (uploaded) or error set
+    """
+    manifest_path = manifest_path or skills_manifest_path()
+    skills = discover_skills(skills_root)
+    if names:
+        skills = {name: path for name, path in skills.items() if name in names}
+    manifest = load_manifest(manifest_path)
+    plan = plan_sync(skills, manifest)
+    pending = [item for item in plan if item["action"] != "unchanged"]
+    if dry_run or not pending:
+        return plan
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(upload_skill, client, item, manifest["skills"].get(item["name"])): item
+                   for item in pending}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                item["entry"] = future.result()
+            except Exception as e:
+                item["error"] = str(e)
+                continue
+            manifest["skills"][item["name"]] = item["entry"]
+            save_manifest(manifest_path, manifest)
+    return plan
+
+def format_plan(plan):
+    """
+    Formats a sync plan (and its results)
+
+    Args:
+        plan: List of plan items
+
+    Returns:
+        str with one line per skill
+    """
+    icons = {"create": "🆕", "update": "🔄", "unchanged": "✅"}
+    lines = []
+    for item in plan:
+        line = f"{icons[item['action']]} {item['name']}: {item['action']}"
+        if item["action"] == "update":
+            line += f" ({', '.join(item['changed'])})"
+        if item.get("entry"):
+            line += f" -> {item['entry']['skill_id']} @ {item['entry']['version']}"
+        if item.get("error"):
+            line = f"❌ {item['name']}: {item['error']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Upload the skills whose files changed")
+    parser.add_argument("--skills", nargs="*", help="Skill names to sync (default: all)")
+    parser.add_argument("--manifest", help="Manifest of uploaded versions (default: $SKILLS_MANIFEST or .skill-versions.json)")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel uploads")
+    parser.add_argument("--dry-run", action="store_true", help="Only show what would be uploaded")
+    parser.add_argument("--fake", action="store_true",
+                        help="Upload to an in-process fake server (uses a temporary manifest by default)")
+    args = parser.parse_args()
+
+    manifest_path = args.manifest
+    server = None
+    client = None
+    if args.fake:
+        from anthropic import Anthropic
+        from fake_anthropic_server import FakeAnthropicServer
+
+        # Fake skill ids must never be pinned in real requests
+        manifest_path = manifest_path or os.path.join(tempfile.mkdtemp(), "skill-versions.json")
+        server = FakeAnthropicServer(latency=0.2).start()
+        client = Anthropic(api_key="fake-key", base_url=server.url)
+    elif not args.dry_run:
+        from anthropic import Anthropic
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        if not os.getenv("ANTHROPIC_API_KEY"):
+            raise ValueError("ANTHROPIC_API_KEY not found. Configure your .env file.")
+        client = Anthropic()
+    manifest_path = manifest_path or skills_manifest_path()
+
+    try:
+        start = time.perf_counter()
+        plan = sync_skills(client, manifest_path=manifest_path, workers=args.workers,
+                           dry_run=args.dry_run, names=args.skills)
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.stop()
+
+    print(format_plan(plan))
+    uploaded = sum(1 for item in plan if item.get("entry"))
+    print(f"\n📦 {uploaded} uploaded, {sum(1 for i in plan if i['action'] == 'unchanged')} unchanged "
+          f"in {elapsed:.2f}s (manifest: {manifest_path})")
+    if not args.dry_run:
+        print("📌 Pinned skills:")
+        for skill in pinned_skills(manifest_path):
+            print(f"   {skill['skill_id']} @ {skill['version']}")
+    return 1 if any(item.get("error") for item in plan) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Stream Renderer - Renders a streamed Claude response as it arrives
+
+Prints text deltas and tool-use blocks incrementally and measures
+time-to-first-token (TTFT) and output tokens per second. Tool blocks are
+rendered like complete_example's non-streaming output: the tool name when
+the block starts, its input (truncated) once the block is complete.
+"""
+
+import json
+import sys
+import time
+
+TOOL_BLOCK_TYPES = ("tool_use", "server_tool_use")
+
+def stream_message(client, params, render=True, out=sys.stdout):
+    """
+    Sends a request through the SDK event stream
+
+    Args:
+        client: Anthropic client
+        params: Parameters for client.beta.messages.create (without stream)
+        render: If True, prints text and tool blocks as they arrive
+        out: Output stream for rendering
+
+    Returns:
+        tuple (final message, dict with streaming metrics)
+    """
+    started = time.perf_counter()
+    first_token_at = None
+    # Accumulated input_json_delta fragments of the open tool blocks, by index
+    tool_inputs = {}
+
+    with client.beta.messages.stream(**params) as stream:
+        for event in stream:
+            if event.type == "content_block_start":
+                block = event.content_block
+                if block.type in TOOL_BLOCK_TYPES:
+                    first_token_at = first_token_at or time.perf_counter()
+                    tool_inputs[event.index] = []
+                    if render:
+                        out.write(f"\n🔧 Tool used: {block.name}\n")
+                        out.flush()
+            elif event.type == "content_block_delta":
+                first_token_at = first_token_at or time.perf_counter()
+                if render and event.delta.type == "text_delta":
+                    out.write(event.delta.text)
+                    out.flush()
+                elif event.delta.type == "input_json_delta" and event.index in tool_inputs:
+                    tool_inputs[event.index].append(event.delta.partial_json)
+            elif event.type == "content_block_stop":
+                partial_json = tool_inputs.pop(event.index, None)
+                if render and partial_json is not None:
+                    out.write(f"   Input: {str(parse_tool_input(partial_json))[:200]}...\n")
+                if render:
+                    out.write("\n")
+                    out.flush()
+        message = stream.get_final_message()
+
+    finished = time.perf_counter()
+    return message, stream_metrics(message, started, first_token_at, finished)
+
+def parse_tool_input(partial_json):
+    """
+    Decodes the input of a streamed tool block
+
+    Args:
+        partial_json: List of input_json_delta fragments
+
+    Returns:
+        dict with the input (the raw text if it is not valid JSON)
+    """
+    text = "".join(partial_json)
+    try:
+        return json.loads(text) if text else {}
+    except ValueError:
+        return text
+
+def stream_metrics(message, started, first_token_at, finished):
+    """
+    Computes TTFT and generation speed for a streamed message
+
+    Args:
+        message: Final message
+        started: perf_counter value when the request was sent
+        first_token_at: perf_counter value of the first content event (or None)
+        finished: perf_counter value when the stream ended
+
+    Returns:
+        dict with ttft, elapsed and tokens_per_second
+    """
+    first_token_at = first_token_at or finished
+    generation_time = finished - first_token_at
+    output_tokens = message.usage.output_tokens
+    return {
+        'ttft': first_token_at - started,
+        'elapsed': finished - started,
+        'output_tokens': output_tokens,
+        'tokens_per_second': output_tokens / generation_time if generation_time > 0 else 0.0
+    }
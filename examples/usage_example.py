@@ -7,6 +7,8 @@ import os
 from dotenv import load_dotenv
 from pathlib import Path
 
+from instrumentation import instrument
+
 # Load environment variables
 load_dotenv()
 
@@ -16,8 +18,8 @@ MODEL = os.getenv("ANTHROPIC_MODEL", "claude-sonnet-4-5")
 if not API_KEY:
     raise ValueError("ANTHROPIC_API_KEY not found. Configure your .env file.")
 
-# Initialize client
-client = Anthropic(api_key=API_KEY)
+# Initialize client (API calls are recorded in instrumentation.METRICS)
+client = instrument(Anthropic(api_key=API_KEY))
 
 def create_development_request(user_requirement, project_path=None):
     """
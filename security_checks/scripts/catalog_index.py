@@ -0,0 +1,258 @@
+"""
+Catalog Index - Precompiled, memory-mapped index of the security_checks catalogue
+
+The build step parses every check document once and writes a compact
+versioned file:
+
+    [magic 'SCIX'][format version: u16][header length: u32]
+    [header JSON: lookup tables + record offsets][records: one JSON per check]
+
+Loading only maps the file and decodes the header; lookups by id,
+category, risk level or technology are dict accesses and check records
+are decoded lazily on first access. The header lists the name, size and
+mtime of every document, so a stat pass on load detects edits and the
+index is rebuilt when the catalogue changed.
+
+Usage:
+    python catalog_index.py build
+    python catalog_index.py query --risk CRITICAL --technology python
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+from catalog_parser import CATALOG_ROOT, load_catalog
+
+MAGIC = b'SCIX'
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct('<4sHI')
+DEFAULT_INDEX_PATH = CATALOG_ROOT / 'catalog.idx'
+
+def catalog_digest(root=CATALOG_ROOT):
+    """
+    Computes a digest of the check documents (the catalogue version)
+
+    Args:
+        root: security_checks directory
+
+    Returns:
+        str with a short hex digest
+    """
+    # Imported here: only builds and is_current() need it, and it slows down the CLI startup
+    import hashlib
+
+    digest = hashlib.sha256()
+    for path in catalog_documents(root):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+def catalog_documents(root=CATALOG_ROOT):
+    """Returns the check document paths, sorted"""
+    return sorted(Path(root).glob('*/[0-9]*_*.md'))
+
+def catalog_stat(root=CATALOG_ROOT):
+    """
+    Lists the name, size and mtime of every check document (cheap freshness key)
+
+    Args:
+        root: security_checks directory
+
+    Returns:
+        list of [relative path, size, mtime in ns]
+    """
+    sources = []
+    for path in catalog_documents(root):
+        stat = path.stat()
+        sources.append([path.relative_to(root).as_posix(), stat.st_size, stat.st_mtime_ns])
+    return sources
+
+def build_index(root=CATALOG_ROOT, output=DEFAULT_INDEX_PATH):
+    """
+    Compiles the catalogue into an index file
+
+    Args:
+        root: security_checks directory
+        output: Path of the index file
+
+    Returns:
+        dict with the written header
+    """
+    records = bytearray()
+    offsets = {}
+    by_category = {}
+    by_risk = {}
+    by_technology = {}
+
+    for check in load_catalog(root):
+        data = json.dumps(check, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        offsets[check['id']] = [len(records), len(data)]
+        records.extend(data)
+        by_category.setdefault(check['category'], []).append(check['id'])
+        by_risk.setdefault(check['risk_level'] or 'UNKNOWN', []).append(check['id'])
+        for technology in check['technologies']:
+            by_technology.setdefault(technology, []).append(check['id'])
+
+    header = {
+        'catalog_version': catalog_digest(root),
+        'sources': catalog_stat(root),
+        'checks': offsets,
+        'by_category': by_category,
+        'by_risk': by_risk,
+        'by_technology': by_technology
+    }
+    header_data = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = Path(f"{output}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_data)))
+        f.write(header_data)
+        f.write(records)
+    tmp_path.replace(output)
+    return header
+
+class CatalogIndex:
+    """
+    Read-only view of an index file
+
+    Args:
+        path: Path of the index file
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_length = PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} catalogue index")
+        self._data_start = PREAMBLE.size + header_length
+        self.header = json.loads(self._mmap[PREAMBLE.size:self._data_start])
+        self._records = {}
+
+    @property
+    def version(self):
+        return self.header['catalog_version']
+
+    def ids(self):
+        """Returns all check ids"""
+        return list(self.header['checks'])
+
+    def get(self, check_id):
+        """
+        Returns the record of a check (decoded on first access)
+
+        Args:
+            check_id: Check id or number ('03', 3)
+
+        Returns:
+            dict with the check, or None if it does not exist
+        """
+        check_id = f"{int(check_id):02d}"
+        record = self._records.get(check_id)
+        if record is None:
+            location = self.header['checks'].get(check_id)
+            if location is None:
+                return None
+            start = self._data_start + location[0]
+            record = self._records[check_id] = json.loads(self._mmap[start:start + location[1]])
+        return record
+
+    def all(self):
+        """Returns every check record"""
+        return [self.get(check_id) for check_id in self.ids()]
+
+    def by_category(self, category):
+        """Returns the check ids of a category directory"""
+        return list(self.header['by_category'].get(category, []))
+
+    def by_risk(self, risk_level):
+        """Returns the check ids of a risk level"""
+        return list(self.header['by_risk'].get(risk_level.upper(), []))
+
+    def by_technology(self, technology):
+        """Returns the check ids that refer to a technology"""
+        return list(self.header['by_technology'].get(technology.lower(), []))
+
+    def is_current(self, root=CATALOG_ROOT):
+        """Returns True if the index matches the documents on disk"""
+        return self.version == catalog_digest(root)
+
+    def is_stale(self, root=CATALOG_ROOT):
+        """Returns True if any document was added, removed or modified (stat only)"""
+        return self.header.get('sources') != catalog_stat(root)
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_index(path=DEFAULT_INDEX_PATH, root=CATALOG_ROOT, build_if_missing=True):
+    """
+    Opens the catalogue index, building it first if it is missing or stale
+
+    Freshness is checked by comparing the size and mtime of the documents
+    with those recorded at build time (no document is read).
+
+    Args:
+        path: Path of the index file
+        root: security_checks directory used when building
+        build_if_missing: If True, builds a missing, unreadable or stale index
+
+    Returns:
+        CatalogIndex
+    """
+    try:
+        index = CatalogIndex(path)
+    except (OSError, ValueError, struct.error):
+        if not build_if_missing:
+            raise
+    else:
+        if not build_if_missing or not index.is_stale(root):
+            return index
+        index.close()
+    build_index(root, path)
+    return CatalogIndex(path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the security checks index")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help="Compile the catalogue into the index")
+    build_parser.add_argument('--output', default=str(DEFAULT_INDEX_PATH))
+    query_parser = subparsers.add_parser('query', help="Look up checks")
+    query_parser.add_argument('--index', default=str(DEFAULT_INDEX_PATH))
+    query_parser.add_argument('--category')
+    query_parser.add_argument('--risk')
+    query_parser.add_argument('--technology')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        header = build_index(output=args.output)
+        print(f"✅ Indexed {len(header['checks'])} checks "
+              f"(version {header['catalog_version']}) into {args.output}")
+        return 0
+
+    with load_index(args.index) as index:
+        ids = set(index.ids())
+        if args.category:
+            ids &= set(index.by_category(args.category))
+        if args.risk:
+            ids &= set(index.by_risk(args.risk))
+        if args.technology:
+            ids &= set(index.by_technology(args.technology))
+        for check_id in sorted(ids):
+            check = index.get(check_id)
+            print(f"{check_id}. [{check['risk_level']}] {check['title']} ({check['path']})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Catalog Parser - Reads the security_checks Markdown catalogue
+"""
+
+import re
+from pathlib import Path
+
+CATALOG_ROOT = Path(__file__).resolve().parent.parent
+
+RISK_LEVELS = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
+
+TITLE_RE = re.compile(r'^#\s+(\d+)\.\s+(.+?)\s*$', re.MULTILINE)
+RISK_RE = re.compile(r'Risk Level:\s*\*\*([A-Z]+)\*\*')
+# grep commands with a quoted pattern, e.g. grep -r "AKIA[0-9A-Z]" .
+GREP_RE = re.compile(r'\bgrep((?:\s+-[A-Za-z]+)+)\s+("(?:[^"\\]|\\.)*"|\'[^\']*\')')
+FENCE_RE = re.compile(r'^```(\w+)', re.MULTILINE)
+VERIFICATION_RE = re.compile(r'^## ✅ Verification Requirements\s*$(.*?)(?=^## |\Z)', re.MULTILINE | re.DOTALL)
+VERIFICATION_ITEM_RE = re.compile(r'^\d+\.\s+\*\*(.+?)\*\*\s*$')
+
+# Technologies implied by the code examples of a document
+TECHNOLOGY_FENCES = {
+    'javascript': ['javascript'],
+    'typescript': ['javascript'],
+    'jsx': ['javascript', 'react'],
+    'vue': ['javascript', 'vue'],
+    'html': ['web'],
+    'python': ['python'],
+    'sql': ['sql'],
+    'dockerfile': ['docker'],
+    'hcl': ['terraform'],
+    'c': ['c'],
+    'cpp': ['c'],
+    'nginx': ['webserver'],
+    'apache': ['webserver']
+}
+
+# Technologies named in the text of a document
+TECHNOLOGY_KEYWORDS = {
+    'react': re.compile(r'\bReact\b'),
+    'node': re.compile(r'\b(?:Node\.js|Express|npm)\b'),
+    'python': re.compile(r'\b(?:Python|Django|Flask|FastAPI)\b'),
+    'java': re.compile(r'\bJava\b'),
+    'docker': re.compile(r'\bDocker'),
+    'kubernetes': re.compile(r'\bKubernetes\b'),
+    'terraform': re.compile(r'\bTerraform\b'),
+    'supabase': re.compile(r'\bSupabase\b')
+}
+
+def bre_to_python(pattern):
+    """
+    Converts a grep basic regular expression into a Python regex
+
+    In BRE, \\| \\( \\) \\{ \\} \\+ \\? are operators and the bare
+    characters are literals; Python uses the opposite convention.
+
+    Args:
+        pattern: BRE pattern
+
+    Returns:
+        str with the equivalent Python pattern
+    """
+    result = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            following = pattern[i + 1]
+            result.append(following if following in '|(){}+?' else char + following)
+            i += 2
+            continue
+        result.append('\\' + char if char in '|(){}+?' else char)
+        i += 1
+    return ''.join(result)
+
+def unquote_shell(quoted):
+    """
+    Removes shell quoting from a single- or double-quoted word
+
+    Args:
+        quoted: Quoted word including its quotes
+
+    Returns:
+        str with the unquoted value
+    """
+    if quoted.startswith("'"):
+        return quoted[1:-1]
+    return re.sub(r'\\(["\\$`])', r'\1', quoted[1:-1])
+
+def extract_grep_patterns(text):
+    """
+    Extracts the recursive grep patterns of a check document
+
+    Only `grep -r` commands are used: they are the ones that search the
+    source tree (others filter command output or single files).
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        list of dicts with regex (Python syntax), ignore_case and source command
+    """
+    patterns = []
+    for match in GREP_RE.finditer(text):
+        flags = match.group(1).replace('-', '').replace(' ', '')
+        if 'r' not in flags and 'R' not in flags:
+            continue
+        raw = unquote_shell(match.group(2))
+        regex = raw if 'E' in flags else bre_to_python(raw)
+        try:
+            re.compile(regex)
+        except re.error:
+            continue
+        patterns.append({
+            'regex': regex,
+            'ignore_case': 'i' in flags,
+            'source': match.group(0)
+        })
+    return patterns
+
+def extract_verification_items(text):
+    """
+    Extracts the "Must Have" items of the Verification Requirements section
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        list of dicts with title and details
+    """
+    section = VERIFICATION_RE.search(text)
+    if not section:
+        return []
+    items = []
+    for line in section.group(1).splitlines():
+        item = VERIFICATION_ITEM_RE.match(line.strip())
+        if item:
+            items.append({'title': item.group(1), 'details': []})
+        elif items and line.strip().startswith('- '):
+            items[-1]['details'].append(line.strip()[2:])
+    return items
+
+def identify_check_technologies(text):
+    """
+    Identifies the technologies a check document refers to
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        sorted list of technology tags
+    """
+    technologies = set()
+    for language in FENCE_RE.findall(text):
+        technologies.update(TECHNOLOGY_FENCES.get(language, []))
+    for technology, pattern in TECHNOLOGY_KEYWORDS.items():
+        if pattern.search(text):
+            technologies.add(technology)
+    return sorted(technologies)
+
+def parse_check_document(path):
+    """
+    Parses a security check document
+
+    Args:
+        path: Path of the Markdown document
+
+    Returns:
+        dict with id, number, slug, title, category, risk_level, technologies,
+        grep_patterns and verification_items (None if the file is not a numbered check)
+    """
+    path = Path(path)
+    text = path.read_text(encoding='utf-8')
+    title = TITLE_RE.search(text)
+    if not title:
+        return None
+    risk = RISK_RE.search(text)
+    number = int(title.group(1))
+    return {
+        'id': f"{number:02d}",
+        'number': number,
+        'slug': path.stem,
+        'title': title.group(2),
+        'category': path.parent.name,
+        'risk_level': risk.group(1) if risk and risk.group(1) in RISK_LEVELS else None,
+        'path': f"{path.parent.name}/{path.name}",
+        'technologies': identify_check_technologies(text),
+        'grep_patterns': extract_grep_patterns(text),
+        'verification_items': extract_verification_items(text)
+    }
+
+def load_catalog(root=CATALOG_ROOT):
+    """
+    Loads every check document of the catalogue
+
+    Args:
+        root: security_checks directory
+
+    Returns:
+        list of check dicts sorted by number
+    """
+    checks = []
+    for path in sorted(Path(root).glob('*/[0-9]*_*.md')):
+        check = parse_check_document(path)
+        if check:
+            checks.append(check)
+    return sorted(checks, key=lambda c: c['number'])
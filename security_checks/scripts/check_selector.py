@@ -0,0 +1,193 @@
+"""
+Check Selector - Selects the security checks that apply to a project
+
+Detects the project stack (reusing codebase_analyzer from the
+codebase_understanding skill) and drops the checks that are specific to
+technologies the project does not use, e.g. prototype pollution for a
+pure-Python repository. Manifests and file extensions are looked for in
+the whole tree (a monorepo with a frontend/ folder is a JavaScript
+project too). Checks that are not technology-specific always apply, and
+nothing is dropped when the stack cannot be detected or the tree is too
+large to inspect.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+from catalog_index import load_index
+from catalog_parser import RISK_LEVELS
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'skills' / 'codebase_understanding' / 'scripts'))
+
+from codebase_analyzer import identify_technologies
+
+IGNORED_DIRS = ['.git', 'node_modules', 'venv', '.venv', '__pycache__', 'dist', 'build']
+
+# Trees with more files than this are not inspected (every check is kept)
+MAX_DETECTION_FILES = 50000
+
+# Checks that only apply to projects using one of the listed technologies
+TECHNOLOGY_SPECIFIC_CHECKS = {
+    '04': ['javascript'],           # Privileged secrets in frontend bundles
+    '07': ['supabase', 'sql'],      # Row level security
+    '20': ['c', 'cpp', 'rust'],     # Memory safety violations
+    '24': ['javascript'],           # Prototype pollution
+    '25': ['javascript'],           # Browser session storage
+    '30': ['docker'],               # Overprivileged containers
+    '39': ['javascript'],           # DOM injection
+    '44': ['terraform']             # Insecure infrastructure as code
+}
+
+# Manifest files and the technologies they reveal
+MANIFEST_TECHNOLOGIES = {
+    'package.json': ['javascript'],
+    'requirements.txt': ['python'],
+    'pyproject.toml': ['python'],
+    'setup.py': ['python'],
+    'Pipfile': ['python'],
+    'Dockerfile': ['docker'],
+    'docker-compose.yml': ['docker'],
+    'docker-compose.yaml': ['docker'],
+    'Cargo.toml': ['rust'],
+    'go.mod': ['go'],
+    'pom.xml': ['java'],
+    'build.gradle': ['java'],
+    'CMakeLists.txt': ['c', 'cpp'],
+    'supabase': ['supabase', 'sql']
+}
+
+# File extensions and the technologies they reveal
+EXTENSION_TECHNOLOGIES = {
+    '.js': ['javascript'],
+    '.jsx': ['javascript'],
+    '.mjs': ['javascript'],
+    '.cjs': ['javascript'],
+    '.ts': ['javascript'],
+    '.tsx': ['javascript'],
+    '.vue': ['javascript'],
+    '.svelte': ['javascript'],
+    '.html': ['javascript'],
+    '.py': ['python'],
+    '.rs': ['rust'],
+    '.go': ['go'],
+    '.java': ['java'],
+    '.tf': ['terraform'],
+    '.sql': ['sql'],
+    '.c': ['c'],
+    '.h': ['c'],
+    '.cpp': ['cpp'],
+    '.cc': ['cpp'],
+    '.hpp': ['cpp']
+}
+
+SUPABASE_LIBRARIES = {'supabase', '@supabase/supabase-js'}
+
+SQL_LIBRARIES = {
+    'psycopg', 'psycopg2', 'psycopg2-binary', 'sqlalchemy', 'mysqlclient', 'pymysql',
+    'pg', 'mysql2', 'prisma', '@prisma/client', 'knex', 'sequelize', 'typeorm'
+}
+
+def identify_tree_technologies(root_path):
+    """
+    Identifies technologies from the manifests and file extensions of a tree
+
+    Args:
+        root_path: Project root path
+
+    Returns:
+        set of technology tags, or None if the tree has too many files to inspect
+    """
+    tags = set()
+    seen = 0
+    for _, dirs, files in os.walk(root_path):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+        for name in dirs:
+            tags.update(MANIFEST_TECHNOLOGIES.get(name, []))
+        for name in files:
+            tags.update(MANIFEST_TECHNOLOGIES.get(name, []))
+            tags.update(EXTENSION_TECHNOLOGIES.get(os.path.splitext(name)[1].lower(), []))
+        seen += len(files)
+        if seen > MAX_DETECTION_FILES:
+            return None
+    return tags
+
+def identify_project_technologies(root_path):
+    """
+    Identifies the technology tags of a project
+
+    Args:
+        root_path: Project root path
+
+    Returns:
+        set of technology tags (empty if nothing was detected)
+    """
+    root = Path(root_path)
+    tags = identify_tree_technologies(root)
+    if tags is None:
+        return set()
+
+    stack = identify_technologies(root)
+    if stack['framework'] == 'React':
+        tags.add('react')
+    libraries = {re.split(r'[<>=!~\[; ]', library)[0].lower() for library in stack['libraries']}
+    if libraries & SUPABASE_LIBRARIES:
+        tags.update(['supabase', 'sql'])
+    if libraries & SQL_LIBRARIES:
+        tags.add('sql')
+    return tags
+
+def is_applicable(check_id, technologies):
+    """
+    Tells whether a check applies to a set of project technologies
+
+    Args:
+        check_id: Check id ('24')
+        technologies: Project technology tags (empty means unknown stack)
+
+    Returns:
+        bool
+    """
+    required = TECHNOLOGY_SPECIFIC_CHECKS.get(check_id)
+    if not required or not technologies:
+        return True
+    return bool(set(required) & set(technologies))
+
+def select_applicable_checks(root_path, checks=None):
+    """
+    Returns the checks that apply to a project
+
+    Args:
+        root_path: Project root path
+        checks: Check records (defaults to the whole catalogue index)
+
+    Returns:
+        list of applicable check records
+    """
+    checks = load_index().all() if checks is None else checks
+    technologies = identify_project_technologies(root_path)
+    return [c for c in checks if is_applicable(c['id'], technologies)]
+
+def format_checks_context(checks, min_risk='HIGH'):
+    """
+    Formats applicable checks as a compact prompt section
+
+    Args:
+        checks: Check records
+        min_risk: Minimum risk level listed
+
+    Returns:
+        str with one line per check, most severe first
+    """
+    allowed = RISK_LEVELS[:RISK_LEVELS.index(min_risk) + 1]
+    selected = sorted((c for c in checks if c['risk_level'] in allowed),
+                      key=lambda c: (RISK_LEVELS.index(c['risk_level']), c['number']))
+    return "\n".join(f"- {c['id']}. {c['title']} [{c['risk_level']}]" for c in selected)
+
+if __name__ == '__main__':
+    project = sys.argv[1] if len(sys.argv) > 1 else '.'
+    applicable = select_applicable_checks(project)
+    print(f"Technologies: {', '.join(sorted(identify_project_technologies(project))) or 'unknown'}")
+    print(f"Applicable checks: {len(applicable)}/{len(load_index().ids())}")
+    print(format_checks_context(applicable, min_risk='LOW'))
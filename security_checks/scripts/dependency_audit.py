@@ -0,0 +1,690 @@
+"""
+Dependency Audit - Offline lockfile audit against an advisory index
+
+Automates checks 06 (outdated dependencies), 21 (AI dependency
+hallucination) and 32 (missing lockfiles) without network access:
+
+1. `import` reads OSV advisories (JSON files, directories or the
+   per-ecosystem `all.zip` dumps from osv.dev) and optional lists of known
+   package names (one per line) into a sorted, memory-mapped index:
+
+       [magic 'SDAX'][format version: u16][header length: u32][header JSON]
+       [entries: (key offset u32, key length u16, flags u16,
+                  record offset u32, record length u32) sorted by key]
+       [keys: 'ecosystem\\0name'][records: one JSON per package]
+
+2. `audit` parses package-lock.json, poetry.lock, requirements.txt and
+   Cargo.lock files, looks every resolved package up by binary search in
+   the mapped entries and evaluates the advisory version ranges.
+
+Usage:
+    python dependency_audit.py import --osv npm-all.zip PyPI-all.zip --known npm=npm-names.txt
+    python dependency_audit.py audit [path] [--json | --format sarif]
+    python dependency_audit.py lookup pypi requests 2.19.0
+"""
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+
+from catalog_index import load_index
+from catalog_parser import CATALOG_ROOT
+from findings_output import STREAMING_FORMATS, add_output_arguments, write_findings
+from security_scanner import IGNORED_DIRS, format_findings
+
+MAGIC = b'SDAX'
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct('<4sHI')
+ENTRY = struct.Struct('<IHHII')
+DEFAULT_ADVISORY_INDEX_PATH = CATALOG_ROOT / 'advisories.idx'
+
+KNOWN_PACKAGE = 1
+
+# Every FENCE_STRIDE-th key is kept in memory to narrow the binary search
+FENCE_STRIDE = 128
+
+# OSV ecosystem names and the keys used in the index
+OSV_ECOSYSTEMS = {'npm': 'npm', 'PyPI': 'pypi', 'crates.io': 'crates.io'}
+
+# OSV severities mapped to the catalogue risk levels
+SEVERITY_LEVELS = {'CRITICAL': 'CRITICAL', 'HIGH': 'HIGH', 'MODERATE': 'MEDIUM', 'MEDIUM': 'MEDIUM', 'LOW': 'LOW'}
+
+OUTDATED_CHECK = '06'
+HALLUCINATION_CHECK = '21'
+LOCKFILE_CHECK = '32'
+
+VERSION_RE = re.compile(
+    r'^v?(?:(\d+)!)?(\d+(?:\.\d+)*)'
+    r'(?:[-_.]?(a|alpha|b|beta|c|rc|pre|preview)[-_.]?(\d*))?'
+    r'(?:[-_.]?(post|rev|r)[-_.]?(\d*))?'
+    r'(?:[-_.]?dev[-_.]?(\d*))?'
+    r'(?:\+.*)?$',
+    re.IGNORECASE
+)
+PRE_RELEASE_RANKS = {'a': 0, 'alpha': 0, 'b': 1, 'beta': 1, 'c': 2, 'rc': 2, 'pre': 2, 'preview': 2}
+SEMVER_RE = re.compile(r'^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:-([0-9A-Za-z\-]+(?:\.[0-9A-Za-z\-]+)*))?(?:\+.*)?$')
+
+# Ecosystems whose versions follow SemVer (the others use PEP 440)
+SEMVER_ECOSYSTEMS = {'npm', 'crates.io'}
+
+REQUIREMENT_RE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._\-]*)\s*(?:\[[^\]]*\])?\s*(?:===?\s*([^\s;,#]+))?')
+PACKAGE_LOCK_KEY_RE = re.compile(r'^\s*"((?:[^"]*/)?node_modules/[^"]+|[^"]+)": \{')
+
+def normalize_name(ecosystem, name):
+    """
+    Normalizes a package name for lookups (PEP 503 for PyPI)
+
+    Args:
+        ecosystem: Ecosystem key ('npm', 'pypi', 'crates.io')
+        name: Package name
+
+    Returns:
+        str with the normalized name
+    """
+    if ecosystem == 'pypi':
+        return re.sub(r'[-_.]+', '-', name).lower()
+    if ecosystem == 'crates.io':
+        return name.lower().replace('_', '-')
+    return name
+
+def package_key(ecosystem, name):
+    """Returns the sort key of a package in the index"""
+    return f"{ecosystem}\0{normalize_name(ecosystem, name)}".encode('utf-8')
+
+def parse_semver(version):
+    """
+    Parses a SemVer version into a comparable tuple
+
+    Pre-release identifiers are compared one by one, numeric ones
+    numerically and below alphanumeric ones; a release sorts after all of
+    its pre-releases and build metadata is ignored.
+
+    Args:
+        version: Version string ('1.2.3', '4.0.0-next.1', '0.0.0-experimental-abc')
+
+    Returns:
+        tuple, or None if the version cannot be parsed
+    """
+    match = SEMVER_RE.match(version.strip())
+    if not match:
+        return None
+    major, minor, patch, pre = match.groups()
+    release = (int(major), int(minor or 0), int(patch or 0))
+    if pre is None:
+        return (release, (1,))
+    identifiers = tuple((0, int(part), '') if part.isdigit() else (1, 0, part) for part in pre.split('.'))
+    return (release, (0, identifiers))
+
+@lru_cache(maxsize=8192)
+def parse_version(version, ecosystem='pypi'):
+    """
+    Parses a version into a comparable tuple
+
+    npm and crates.io versions follow SemVer, PyPI versions PEP 440.
+
+    Args:
+        version: Version string ('1.2.3', '2.0.0-beta.1', '1.0.post2')
+        ecosystem: Ecosystem key of the package
+
+    Returns:
+        tuple, or None if the version cannot be parsed
+    """
+    if ecosystem in SEMVER_ECOSYSTEMS:
+        return parse_semver(version)
+    match = VERSION_RE.match(version.strip())
+    if not match:
+        return None
+    epoch, release, pre, pre_number, post, post_number, dev = match.groups()
+    parts = [int(part) for part in release.split('.')]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+
+    if pre:
+        pre_key = (0, PRE_RELEASE_RANKS[pre.lower()], int(pre_number or 0))
+    elif dev is not None and not post:
+        pre_key = (-1,)     # 1.0.dev1 sorts before 1.0a1
+    else:
+        pre_key = (1,)
+    post_key = int(post_number or 0) if post else -1
+    dev_key = (0, int(dev or 0)) if dev is not None else (1,)
+    return (int(epoch or 0), tuple(parts), pre_key, post_key, dev_key)
+
+def normalize_ranges(ranges):
+    """
+    Converts OSV range events into [introduced, fixed, last_affected] triples
+
+    Args:
+        ranges: List of OSV ranges (GIT ranges are ignored)
+
+    Returns:
+        list of triples (fixed/last_affected may be None)
+    """
+    triples = []
+    for version_range in ranges:
+        if version_range.get('type') == 'GIT':
+            continue
+        introduced = None
+        for event in version_range.get('events', []):
+            if 'introduced' in event:
+                if introduced is not None:
+                    triples.append([introduced, None, None])
+                introduced = event['introduced']
+            elif introduced is not None and ('fixed' in event or 'limit' in event):
+                triples.append([introduced, event.get('fixed', event.get('limit')), None])
+                introduced = None
+            elif introduced is not None and 'last_affected' in event:
+                triples.append([introduced, None, event['last_affected']])
+                introduced = None
+        if introduced is not None:
+            triples.append([introduced, None, None])
+    return triples
+
+def is_affected(version, advisory, ecosystem='pypi'):
+    """
+    Tells whether a version falls in an advisory's affected versions
+
+    Args:
+        version: Resolved version string
+        advisory: Advisory record from the index
+        ecosystem: Ecosystem key of the package
+
+    Returns:
+        bool
+    """
+    if version in advisory['versions']:
+        return True
+    parsed = parse_version(version, ecosystem)
+    if parsed is None:
+        return False
+    for introduced, fixed, last_affected in advisory['ranges']:
+        if introduced != '0':
+            lower = parse_version(introduced, ecosystem)
+            if lower is None or parsed < lower:
+                continue
+        if fixed is not None:
+            upper = parse_version(fixed, ecosystem)
+            if upper is None or parsed >= upper:
+                continue
+        if last_affected is not None:
+            upper = parse_version(last_affected, ecosystem)
+            if upper is None or parsed > upper:
+                continue
+        return True
+    return False
+
+def iter_osv_documents(source):
+    """
+    Yields OSV advisories from a JSON file, a directory or a zip dump
+
+    Args:
+        source: Path of the advisories
+
+    Yields:
+        dicts with OSV advisories
+    """
+    source = Path(source)
+    if source.is_dir():
+        blobs = (path.read_bytes() for path in sorted(source.rglob('*.json')))
+    elif zipfile.is_zipfile(source):
+        archive = zipfile.ZipFile(source)
+        blobs = (archive.read(name) for name in archive.namelist() if name.endswith('.json'))
+    else:
+        blobs = [source.read_bytes()]
+    for blob in blobs:
+        data = json.loads(blob)
+        yield from (data if isinstance(data, list) else [data])
+
+def advisory_record(document, affected):
+    """Builds the stored advisory of one OSV affected package"""
+    severity = (document.get('database_specific') or {}).get('severity') or \
+               (affected.get('database_specific') or {}).get('severity') or ''
+    return {
+        'id': document['id'],
+        'summary': document.get('summary', '')[:200],
+        'severity': SEVERITY_LEVELS.get(str(severity).upper()),
+        'malicious': document['id'].startswith('MAL-'),
+        'ranges': normalize_ranges(affected.get('ranges', [])),
+        'versions': sorted(set(affected.get('versions', [])))
+    }
+
+def build_advisory_index(osv_sources=(), known_sources=None, output=DEFAULT_ADVISORY_INDEX_PATH):
+    """
+    Imports advisories and known package names into an index file
+
+    Args:
+        osv_sources: Paths of OSV advisories (files, directories or zip dumps)
+        known_sources: Dict of ecosystem keys to files with one package name per line
+        output: Path of the index file
+
+    Returns:
+        dict with the written header
+    """
+    packages = {}
+    advisory_count = 0
+    for source in osv_sources:
+        for document in iter_osv_documents(source):
+            if document.get('withdrawn'):
+                continue
+            advisory_count += 1
+            for affected in document.get('affected', []):
+                package = affected.get('package') or {}
+                ecosystem = OSV_ECOSYSTEMS.get(package.get('ecosystem'))
+                if ecosystem and package.get('name'):
+                    entry = packages.setdefault(package_key(ecosystem, package['name']), [0, []])
+                    entry[1].append(advisory_record(document, affected))
+
+    known_ecosystems = sorted(known_sources or {})
+    for ecosystem, path in (known_sources or {}).items():
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                name = line.strip()
+                if name and not name.startswith('#'):
+                    packages.setdefault(package_key(ecosystem, name), [0, []])[0] |= KNOWN_PACKAGE
+
+    entries = bytearray()
+    keys = bytearray()
+    records = bytearray()
+    for key in sorted(packages):
+        flags, advisories = packages[key]
+        record = json.dumps(advisories, separators=(',', ':')).encode('utf-8') if advisories else b''
+        entries.extend(ENTRY.pack(len(keys), len(key), flags, len(records), len(record)))
+        keys.extend(key)
+        records.extend(record)
+
+    header = {
+        'imported_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'sources': [str(s) for s in osv_sources] + [str(p) for p in (known_sources or {}).values()],
+        'known_ecosystems': known_ecosystems,
+        'advisories': advisory_count,
+        'entries': len(packages),
+        'keys_offset': len(entries),
+        'records_offset': len(entries) + len(keys)
+    }
+    header_data = json.dumps(header, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = Path(f"{output}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_data)))
+        f.write(header_data)
+        f.write(entries)
+        f.write(keys)
+        f.write(records)
+    tmp_path.replace(output)
+    return header
+
+class AdvisoryIndex:
+    """
+    Read-only view of an advisory index file
+
+    Args:
+        path: Path of the index file
+    """
+
+    def __init__(self, path=DEFAULT_ADVISORY_INDEX_PATH):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_length = PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} advisory index")
+        self._entries_start = PREAMBLE.size + header_length
+        self.header = json.loads(self._mmap[PREAMBLE.size:self._entries_start])
+        self._count = self.header['entries']
+        self._keys_start = self._entries_start + self.header['keys_offset']
+        self._records_start = self._entries_start + self.header['records_offset']
+        self._fence = None
+
+    def _entry(self, position):
+        return ENTRY.unpack_from(self._mmap, self._entries_start + position * ENTRY.size)
+
+    def _key(self, position):
+        key_offset, key_length = self._entry(position)[:2]
+        start = self._keys_start + key_offset
+        return self._mmap[start:start + key_length]
+
+    def lookup(self, ecosystem, name):
+        """
+        Looks a package up by binary search
+
+        Args:
+            ecosystem: Ecosystem key ('npm', 'pypi', 'crates.io')
+            name: Package name
+
+        Returns:
+            dict with known (True, False, or None if no package list was
+            imported for the ecosystem) and advisories
+        """
+        key = package_key(ecosystem, name)
+        if self._fence is None:
+            self._fence = [self._key(position) for position in range(0, self._count, FENCE_STRIDE)]
+        block = bisect.bisect_left(self._fence, key)
+        if block < len(self._fence) and self._fence[block] == key:
+            low = block * FENCE_STRIDE
+        else:
+            low = max(block - 1, 0) * FENCE_STRIDE
+        high = min(low + FENCE_STRIDE, self._count)
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        known = False if ecosystem in self.header['known_ecosystems'] else None
+        advisories = []
+        if low < self._count and self._key(low) == key:
+            _, _, flags, record_offset, record_length = self._entry(low)
+            if flags & KNOWN_PACKAGE:
+                known = True
+            if record_length:
+                start = self._records_start + record_offset
+                advisories = json.loads(self._mmap[start:start + record_length])
+        return {'known': known, 'advisories': advisories}
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def parse_package_lock(path):
+    """
+    Parses an npm package-lock.json (lockfile versions 1 to 3)
+
+    Args:
+        path: Lockfile path
+
+    Returns:
+        list of package dicts (ecosystem, name, version, file, line)
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    data = json.loads(text)
+    key_lines = {}
+    for number, line in enumerate(text.splitlines(), 1):
+        match = PACKAGE_LOCK_KEY_RE.match(line)
+        if match:
+            key_lines.setdefault(match.group(1), number)
+
+    packages = []
+    if 'packages' in data:
+        for key, info in data['packages'].items():
+            if not key or info.get('link') or not info.get('version'):
+                continue
+            name = info.get('name') or key.rsplit('node_modules/', 1)[-1]
+            packages.append({'ecosystem': 'npm', 'name': name, 'version': info['version'],
+                             'file': str(path), 'line': key_lines.get(key, 1)})
+        return packages
+
+    pending = list(data.get('dependencies', {}).items())
+    while pending:
+        name, info = pending.pop()
+        if info.get('version') and not info['version'].startswith(('file:', 'link:')):
+            packages.append({'ecosystem': 'npm', 'name': name, 'version': info['version'],
+                             'file': str(path), 'line': key_lines.get(name, 1)})
+        pending.extend(info.get('dependencies', {}).items())
+    return packages
+
+def parse_toml_packages(path, ecosystem):
+    """
+    Parses the [[package]] tables of poetry.lock or Cargo.lock
+
+    Only the name, version and source keys are read, so no TOML library
+    is needed. Packages from local paths, git or workspace members are
+    skipped.
+
+    Args:
+        path: Lockfile path
+        ecosystem: Ecosystem key of the packages
+
+    Returns:
+        list of package dicts (ecosystem, name, version, file, line)
+    """
+    packages = []
+    current = None
+    section = None
+    for number, line in enumerate(Path(path).read_text(encoding='utf-8').splitlines(), 1):
+        line = line.strip()
+        if line.startswith('['):
+            section = line
+            if section == '[[package]]':
+                # Cargo packages without a source are workspace members
+                current = {'line': number, 'registry': ecosystem != 'crates.io'}
+                packages.append(current)
+            continue
+        if current is None or '=' not in line:
+            continue
+        key, value = (part.strip().strip('"') for part in line.split('=', 1))
+        if section == '[[package]]':
+            if key in ('name', 'version'):
+                current[key] = value
+            elif key == 'source':
+                current['registry'] = value.startswith('registry+')
+        elif section == '[package.source]' and key == 'type':
+            current['registry'] = value == 'legacy'
+
+    return [{'ecosystem': ecosystem, 'name': p['name'], 'version': p['version'],
+             'file': str(path), 'line': p['line']}
+            for p in packages if p.get('registry') and p.get('name') and p.get('version')]
+
+def parse_requirements(path):
+    """
+    Parses a requirements.txt
+
+    Args:
+        path: Requirements file path
+
+    Returns:
+        list of package dicts; unpinned requirements have version None and
+        none are resolved (`==1.*` is a requirement, not a version)
+    """
+    packages = []
+    for number, line in enumerate(Path(path).read_text(encoding='utf-8').splitlines(), 1):
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith(('#', '-', 'http:', 'https:', 'git+', '.', '/')):
+            continue
+        match = REQUIREMENT_RE.match(line)
+        if match:
+            packages.append({'ecosystem': 'pypi', 'name': match.group(1), 'version': match.group(2),
+                             'file': str(path), 'line': number, 'resolved': False})
+    return packages
+
+LOCKFILE_PARSERS = {
+    'package-lock.json': parse_package_lock,
+    'poetry.lock': lambda path: parse_toml_packages(path, 'pypi'),
+    'Cargo.lock': lambda path: parse_toml_packages(path, 'crates.io'),
+    'requirements.txt': parse_requirements
+}
+
+# Manifests and the lockfiles that should sit next to them
+MANIFEST_LOCKFILES = {
+    'package.json': ['package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'npm-shrinkwrap.json'],
+    'Pipfile': ['Pipfile.lock'],
+    'Cargo.toml': ['Cargo.lock']
+}
+
+def find_dependency_files(root):
+    """
+    Finds lockfiles and manifests without a lockfile
+
+    Args:
+        root: Project root (or a single lockfile)
+
+    Returns:
+        tuple (lockfile paths, manifest paths missing a lockfile)
+    """
+    root = Path(root)
+    if root.is_file():
+        return [root], []
+    lockfiles = []
+    unlocked = []
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+        for name in files:
+            if name in LOCKFILE_PARSERS:
+                lockfiles.append(Path(current, name))
+            if name in MANIFEST_LOCKFILES and not any(lock in files for lock in MANIFEST_LOCKFILES[name]):
+                unlocked.append(Path(current, name))
+    return sorted(lockfiles), sorted(unlocked)
+
+def parse_lockfile(path):
+    """Parses any supported lockfile, based on its name"""
+    return LOCKFILE_PARSERS[Path(path).name](path)
+
+def audit_packages(index, packages, checks):
+    """
+    Matches parsed packages against the advisory index
+
+    Args:
+        index: AdvisoryIndex
+        packages: Package dicts from the lockfile parsers
+        checks: Dict of check ids to check records (06, 21, 32)
+
+    Returns:
+        list of finding dicts
+    """
+    def finding(check_id, package, match, pattern):
+        check = checks[check_id]
+        return {'check': check_id, 'title': check['title'], 'risk_level': check['risk_level'],
+                'category': check['category'], 'file': package['file'], 'line': package['line'],
+                'match': match, 'pattern': pattern}
+
+    findings = []
+    for package in packages:
+        if package['version'] is None:
+            findings.append(finding(LOCKFILE_CHECK, package, f"{package['name']} is not pinned", 'unpinned'))
+            continue
+        entry = index.lookup(package['ecosystem'], package['name'])
+        label = f"{package['name']}@{package['version']}"
+        ecosystem = package['ecosystem']
+        if not package.get('resolved', True) and parse_version(package['version'], ecosystem) is None:
+            # A requirement such as `==1.*` only matches listed versions, ranges cannot be checked
+            findings.append(finding(LOCKFILE_CHECK, package,
+                                    f"{label}: version cannot be compared with advisories", 'unparseable version'))
+        for advisory in entry['advisories']:
+            if not is_affected(package['version'], advisory, ecosystem):
+                continue
+            if advisory['malicious']:
+                findings.append(finding(HALLUCINATION_CHECK, package,
+                                        f"{label}: malicious package ({advisory['id']})", advisory['id']))
+                continue
+            fixed = sorted({r[1] for r in advisory['ranges'] if r[1]}, key=lambda v: parse_version(v, ecosystem) or ())
+            fix = f", fixed in {', '.join(fixed)}" if fixed else ''
+            severity = f" [{advisory['severity']}]" if advisory['severity'] else ''
+            findings.append(finding(OUTDATED_CHECK, package,
+                                    f"{label}: {advisory['id']}{severity}{fix}", advisory['id']))
+        if entry['known'] is False and not entry['advisories']:
+            findings.append(finding(HALLUCINATION_CHECK, package,
+                                    f"{label}: not in the known {package['ecosystem']} packages", 'unknown package'))
+    return findings
+
+def audit_project(root, index):
+    """
+    Audits every lockfile of a project
+
+    Args:
+        root: Project root (or a single lockfile)
+        index: AdvisoryIndex
+
+    Returns:
+        tuple (findings, number of packages audited)
+    """
+    catalog = load_index()
+    checks = {c: catalog.get(c) for c in (OUTDATED_CHECK, HALLUCINATION_CHECK, LOCKFILE_CHECK)}
+    lockfiles, unlocked = find_dependency_files(root)
+    packages = []
+    for path in lockfiles:
+        try:
+            packages.extend(parse_lockfile(path))
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            print(f"⚠️  Could not parse {path}: {e}", file=sys.stderr)
+
+    findings = audit_packages(index, packages, checks)
+    for manifest in unlocked:
+        check = checks[LOCKFILE_CHECK]
+        findings.append({'check': LOCKFILE_CHECK, 'title': check['title'], 'risk_level': check['risk_level'],
+                         'category': check['category'], 'file': str(manifest), 'line': 1,
+                         'match': f"{manifest.name} has no lockfile",
+                         'pattern': 'missing lockfile'})
+    return findings, len(packages)
+
+def parse_known_sources(values):
+    """Parses ecosystem=path arguments"""
+    sources = {}
+    for value in values or []:
+        ecosystem, _, path = value.partition('=')
+        ecosystem = OSV_ECOSYSTEMS.get(ecosystem, ecosystem.lower())
+        if ecosystem not in OSV_ECOSYSTEMS.values() or not path:
+            raise ValueError(f"invalid --known value: {value} (expected npm|pypi|crates.io=path)")
+        sources[ecosystem] = path
+    return sources
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit lockfiles against an offline advisory index")
+    parser.add_argument('--index', default=str(DEFAULT_ADVISORY_INDEX_PATH))
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help="Import advisories and known package names")
+    import_parser.add_argument('--osv', nargs='*', default=[], help="OSV JSON files, directories or zip dumps")
+    import_parser.add_argument('--known', nargs='*', help="Known package lists as ecosystem=path")
+    audit_parser = subparsers.add_parser('audit', help="Audit the lockfiles of a project")
+    audit_parser.add_argument('path', nargs='?', default='.')
+    audit_parser.add_argument('--json', action='store_true', help="Print findings as JSON (same as --format json)")
+    add_output_arguments(audit_parser)
+    lookup_parser = subparsers.add_parser('lookup', help="Look up one package")
+    lookup_parser.add_argument('ecosystem', choices=sorted(OSV_ECOSYSTEMS.values()))
+    lookup_parser.add_argument('name')
+    lookup_parser.add_argument('version', nargs='?')
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        try:
+            known_sources = parse_known_sources(args.known)
+        except ValueError as e:
+            parser.error(str(e))
+        header = build_advisory_index(args.osv, known_sources, args.index)
+        print(f"✅ Imported {header['advisories']} advisories and {header['entries']} packages into {args.index}")
+        return 0
+
+    try:
+        index = AdvisoryIndex(args.index)
+    except (OSError, ValueError, struct.error):
+        print(f"❌ No advisory index at {args.index}; run: python dependency_audit.py import --osv <dump>")
+        return 2
+
+    with index:
+        if args.command == 'lookup':
+            entry = index.lookup(args.ecosystem, args.name)
+            if args.version:
+                entry['advisories'] = [a for a in entry['advisories'] if is_affected(args.version, a, args.ecosystem)]
+            print(json.dumps(entry, indent=2))
+            return 0
+
+        start = time.perf_counter()
+        findings, audited = audit_project(args.path, index)
+        elapsed = time.perf_counter() - start
+    if args.format in STREAMING_FORMATS:
+        catalog = load_index()
+        checks = [catalog.get(c) for c in (OUTDATED_CHECK, HALLUCINATION_CHECK, LOCKFILE_CHECK)]
+        write_findings(findings, args.format, args.output, checks, args.path)
+    elif args.json or args.format == 'json':
+        print(json.dumps(findings, indent=2))
+    else:
+        print(f"📦 Audited {audited} packages in {elapsed * 1000:.1f} ms "
+              f"(advisories imported {index.header['imported_at']})")
+        print(format_findings(findings))
+    return 1 if findings else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Findings Output - Streaming SARIF 2.1 and JSON Lines writers for scanner findings
+
+Findings are written one by one as the scanners produce them, so a large
+scan never holds its results in memory. The SARIF writer emits the log
+header and rules up front and closes the JSON document on close().
+
+Every finding gets a stable fingerprint, exported for matching findings
+across runs (SARIF partialFingerprints / the JSONL `fingerprint` key). It
+hashes the check, file, pattern and matched text, leaving the line number
+out so findings survive unrelated edits, and ends with `:<occurrence>`
+counting identical hashes in the run (like GitHub's primaryLocationLineHash),
+so repeated hits in one file stay distinct.
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_VERSION = '2.1.0'
+TOOL_NAME = 'security-checks'
+FINGERPRINT_KEY = 'securityChecks/v2'
+
+OUTPUT_FORMATS = ['text', 'json', 'jsonl', 'sarif']
+STREAMING_FORMATS = ['jsonl', 'sarif']
+
+# Catalogue risk levels mapped to SARIF result levels
+SARIF_LEVELS = {'CRITICAL': 'error', 'HIGH': 'error', 'MEDIUM': 'warning', 'LOW': 'note'}
+
+def relative_path(path, base_path=None):
+    """
+    Returns a finding path relative to a base directory, with forward slashes
+
+    Args:
+        path: Finding path
+        base_path: Optional base directory (paths outside it are kept as they are)
+
+    Returns:
+        str path
+    """
+    if base_path:
+        relative = os.path.relpath(os.path.abspath(path), os.path.abspath(base_path))
+        if not relative.startswith('..'):
+            path = relative
+    path = Path(path).as_posix()
+    return path[2:] if path.startswith('./') else path
+
+def finding_fingerprint(finding, base_path=None):
+    """
+    Computes the line-free hash of a finding
+
+    Args:
+        finding: Finding dict
+        base_path: Root the finding path is made relative to
+
+    Returns:
+        str with a 32 character hex digest
+    """
+    # Imported here: text output never fingerprints, and it slows down the CLI startup
+    import hashlib
+
+    parts = [
+        finding['check'],
+        relative_path(finding['file'], base_path),
+        finding.get('pattern') or '',
+        ' '.join(str(finding.get('match', '')).split()),
+        finding.get('blob') or ''
+    ]
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()[:32]
+
+class FindingsWriter:
+    """
+    Base class of the streaming writers
+
+    Args:
+        stream: Text stream written to
+        base_path: Findings paths are made relative to it (repository root)
+    """
+
+    def __init__(self, stream, base_path=None):
+        self.stream = stream
+        self.base_path = base_path
+        self.count = 0
+        self._occurrences = Counter()
+
+    def write(self, finding):
+        """
+        Writes a finding
+
+        Args:
+            finding: Finding dict
+
+        Returns:
+            str with the fingerprint of the finding (hash and occurrence)
+        """
+        digest = finding_fingerprint(finding, self.base_path)
+        self._occurrences[digest] += 1
+        fingerprint = f"{digest}:{self._occurrences[digest]}"
+        self._write(finding, fingerprint)
+        self.count += 1
+        return fingerprint
+
+    def _write(self, finding, fingerprint):
+        raise NotImplementedError
+
+    def close(self):
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class JsonlWriter(FindingsWriter):
+    """Writes one JSON object per line, each with its fingerprint"""
+
+    def _write(self, finding, fingerprint):
+        self.stream.write(json.dumps(dict(finding, fingerprint=fingerprint), ensure_ascii=False) + '\n')
+
+class SarifWriter(FindingsWriter):
+    """
+    Writes a SARIF 2.1.0 log with a single run
+
+    Args:
+        stream: Text stream written to
+        checks: Check records described as rules
+        base_path: Findings paths are made relative to it (repository root)
+    """
+
+    def __init__(self, stream, checks=(), base_path=None):
+        super().__init__(stream, base_path)
+        self.rule_indexes = {}
+        rules = []
+        for check in checks:
+            self.rule_indexes[check['id']] = len(rules)
+            rules.append({
+                'id': check['id'],
+                'name': check['slug'],
+                'shortDescription': {'text': check['title']},
+                'help': {'text': f"See security_checks/{check['path']}"},
+                'defaultConfiguration': {'level': SARIF_LEVELS.get(check['risk_level'], 'warning')},
+                'properties': {'category': check['category'], 'risk_level': check['risk_level']}
+            })
+        driver = {'name': TOOL_NAME, 'rules': rules}
+        header = json.dumps({'$schema': SARIF_SCHEMA, 'version': SARIF_VERSION,
+                             'runs': [{'tool': {'driver': driver}, 'results': []}]}, ensure_ascii=False)
+        # Leave the results array open; results are appended as they come
+        self.stream.write(header[:-len(']}]}')] + '\n')
+
+    def _write(self, finding, fingerprint):
+        result = {
+            'ruleId': finding['check'],
+            'level': SARIF_LEVELS.get(finding['risk_level'], 'warning'),
+            'message': {'text': f"{finding['title']}: {finding['match']}"},
+            'locations': [{'physicalLocation': {
+                'artifactLocation': {'uri': relative_path(finding['file'], self.base_path)},
+                'region': {'startLine': max(int(finding['line'] or 1), 1)}
+            }}],
+            'partialFingerprints': {FINGERPRINT_KEY: fingerprint},
+            'properties': {'risk_level': finding['risk_level'], 'category': finding['category']}
+        }
+        if finding['check'] in self.rule_indexes:
+            result['ruleIndex'] = self.rule_indexes[finding['check']]
+        if finding.get('blob'):
+            result['properties']['blob'] = finding['blob']
+        separator = ',\n' if self.count else ''
+        self.stream.write(separator + json.dumps(result, ensure_ascii=False))
+
+    def close(self):
+        self.stream.write('\n]}]}\n')
+        super().close()
+
+def open_writer(output_format, stream=None, checks=(), base_path=None):
+    """
+    Creates the streaming writer of an output format
+
+    Args:
+        output_format: 'jsonl' or 'sarif'
+        stream: Text stream (defaults to stdout)
+        checks: Check records (SARIF rules)
+        base_path: Root that finding paths are made relative to
+
+    Returns:
+        FindingsWriter
+    """
+    stream = stream or sys.stdout
+    if output_format == 'sarif':
+        return SarifWriter(stream, checks, base_path)
+    if output_format == 'jsonl':
+        return JsonlWriter(stream, base_path)
+    raise ValueError(f"Unsupported streaming format: {output_format}")
+
+def write_findings(findings, output_format, output=None, checks=(), base_path=None):
+    """
+    Streams findings to a file or stdout
+
+    Args:
+        findings: Iterable of finding dicts (consumed lazily)
+        output_format: 'jsonl' or 'sarif'
+        output: Optional output file path (defaults to stdout)
+        checks: Check records (SARIF rules)
+        base_path: Root that finding paths are made relative to
+
+    Returns:
+        int with the number of findings written
+    """
+    stream = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    try:
+        with open_writer(output_format, stream, checks, base_path) as writer:
+            for finding in findings:
+                writer.write(finding)
+        return writer.count
+    finally:
+        if output:
+            stream.close()
+
+def add_output_arguments(parser):
+    """Adds the --format and --output options shared by the scanners"""
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='text',
+                        help="Output format (jsonl and sarif are streamed as findings are produced)")
+    parser.add_argument('--output', help="Write jsonl/sarif output to this file instead of stdout")
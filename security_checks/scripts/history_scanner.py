@@ -0,0 +1,264 @@
+"""
+History Scanner - Streams the whole git history looking for leaked secrets
+
+Instead of running grep over `git log -p` once per pattern, every object
+reachable from any ref is listed once by `git rev-list --objects --all`
+(so each unique blob is scanned once, however many commits contain it),
+filtered by `git cat-file --batch-check` and streamed through
+`git cat-file --batch`. Memory stays bounded by the largest blob scanned.
+
+Each blob is checked with the catalogue's secret patterns (check 03,
+combined into one matcher) and with Shannon-entropy scoring of candidate
+tokens (reported under check 14, Leaked Secrets in Git History).
+
+Usage:
+    python history_scanner.py [repo] [--checks 03,05] [--json]
+    python history_scanner.py [repo] --format sarif --output history.sarif
+
+To find the commits containing a reported blob:
+    git log --all --find-object=<blob>
+"""
+
+import argparse
+import json
+import math
+import re
+import subprocess
+import sys
+import threading
+from collections import Counter
+
+from catalog_index import load_index
+from findings_output import STREAMING_FORMATS, add_output_arguments, write_findings
+from security_scanner import MAX_FILE_SIZE, build_pattern_specs, compile_matcher, format_findings, scan_buffer
+
+HISTORY_CHECKS = ['03']
+ENTROPY_CHECK = '14'
+
+TOKEN_RE = re.compile(rb'[A-Za-z0-9+/_\-]{20,}={0,2}')
+# A token continuing a URL (`https://host/...`) is a URL path, not a secret
+URL_PREFIX_RE = re.compile(rb'://[^\s\'"`]*$')
+# Path segments made of a word and an optional number (`src`, `v1`, `lib2`)
+PATH_PART_RE = re.compile(rb'[A-Za-z_\-]*[0-9]*')
+URL_LOOKBEHIND = 256
+DIGIT_RE = re.compile(rb'[0-9]')
+HEX_RE = re.compile(rb'^[0-9a-fA-F]+$')
+BASE64_ENTROPY_THRESHOLD = 4.5
+HEX_ENTROPY_THRESHOLD = 3.0
+MIN_HEX_TOKEN_LENGTH = 32
+
+# Files full of legitimate high-entropy strings (integrity hashes, minified code)
+ENTROPY_IGNORED_SUFFIXES = ('.lock', '-lock.json', '.min.js', '.map', '.svg', 'go.sum')
+
+def shannon_entropy(data):
+    """
+    Computes the Shannon entropy of a byte string in bits per symbol
+
+    Args:
+        data: bytes
+
+    Returns:
+        float entropy
+    """
+    if not data:
+        return 0.0
+    length = len(data)
+    return -sum(count / length * math.log2(count / length) for count in Counter(data).values())
+
+def is_path_like(buffer, start, token):
+    """
+    Tells whether a token is a URL or file path rather than a secret
+
+    Args:
+        buffer: bytes the token was found in
+        start: Offset of the token
+        token: Token bytes
+
+    Returns:
+        bool
+    """
+    if URL_PREFIX_RE.search(buffer, max(0, start - URL_LOOKBEHIND), start):
+        return True
+    if b'/' not in token:
+        return False
+    return all(PATH_PART_RE.fullmatch(part) for part in token.rstrip(b'=').split(b'/'))
+
+def high_entropy_tokens(buffer):
+    """
+    Finds candidate tokens whose entropy suggests a random secret
+
+    Tokens without digits are skipped (identifiers, prose), and so are URL
+    and file paths. Hex tokens use a lower threshold (their alphabet only
+    has 16 symbols) and those of exactly 40 characters are skipped as likely
+    commit hashes.
+
+    Args:
+        buffer: bytes to inspect
+
+    Yields:
+        tuples (offset, token, entropy)
+    """
+    for match in TOKEN_RE.finditer(buffer):
+        token = match.group()
+        if not DIGIT_RE.search(token) or is_path_like(buffer, match.start(), token):
+            continue
+        if HEX_RE.match(token):
+            if len(token) < MIN_HEX_TOKEN_LENGTH or len(token) == 40:
+                continue
+            threshold = HEX_ENTROPY_THRESHOLD
+        else:
+            threshold = BASE64_ENTROPY_THRESHOLD
+        entropy = shannon_entropy(token)
+        if entropy >= threshold:
+            yield match.start(), token, entropy
+
+def mask_secret(value):
+    """Masks a secret, keeping only its first characters"""
+    return value[:6] + '…' if len(value) > 8 else '…'
+
+def iter_history_blobs(repo, max_size=MAX_FILE_SIZE):
+    """
+    Streams every unique blob reachable from any ref
+
+    Args:
+        repo: Repository path
+        max_size: Larger blobs are skipped
+
+    Yields:
+        tuples (blob id, path, content bytes)
+    """
+    git = ['git', '-C', str(repo)]
+    rev_list = subprocess.Popen(git + ['rev-list', '--objects', '--all'], stdout=subprocess.PIPE)
+    batch_check = subprocess.Popen(
+        git + ['cat-file', '--batch-check=%(objectname) %(objecttype) %(objectsize) %(rest)'],
+        stdin=rev_list.stdout, stdout=subprocess.PIPE
+    )
+    rev_list.stdout.close()
+    batch = subprocess.Popen(git + ['cat-file', '--batch=%(objectname) %(objectsize) %(rest)'],
+                             stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def feed_blobs():
+        # Runs in a thread so cat-file --batch output is consumed while we write
+        try:
+            for line in batch_check.stdout:
+                parts = line.rstrip(b'\n').split(b' ', 3)
+                if len(parts) >= 3 and parts[1] == b'blob' and int(parts[2]) <= max_size:
+                    path = parts[3] if len(parts) == 4 else b''
+                    batch.stdin.write(parts[0] + b' ' + path + b'\n')
+        finally:
+            batch.stdin.close()
+
+    feeder = threading.Thread(target=feed_blobs, daemon=True)
+    feeder.start()
+    try:
+        while True:
+            header = batch.stdout.readline()
+            if not header:
+                break
+            oid, size, path = (header.rstrip(b'\n').split(b' ', 2) + [b''])[:3]
+            content = batch.stdout.read(int(size))
+            batch.stdout.read(1)  # Trailing newline
+            yield oid.decode(), path.decode('utf-8', 'replace'), content
+    finally:
+        feeder.join(timeout=1)
+        for process in (batch, batch_check, rev_list):
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+def scan_blob(oid, path, content, matcher, specs, entropy_check=None):
+    """
+    Scans one blob with the patterns and entropy scoring
+
+    Args:
+        oid: Blob id
+        path: A path the blob was committed under
+        content: Blob bytes
+        matcher: Compiled combined regex
+        specs: Pattern specs
+        entropy_check: Check record used to tag entropy findings (None disables them)
+
+    Returns:
+        list of finding dicts
+    """
+    if b'\0' in content[:8192]:
+        return []
+    findings = scan_buffer(content, matcher, specs, path) if specs else []
+    for finding in findings:
+        finding['match'] = mask_secret(finding['match'])
+
+    if entropy_check and not path.endswith(ENTROPY_IGNORED_SUFFIXES):
+        reported = {(f['line'], f['match'][:6]) for f in findings}
+        # Tokens come in offset order: count newlines from the previous one
+        line = 1
+        last = 0
+        for offset, token, entropy in high_entropy_tokens(content):
+            line += content.count(b'\n', last, offset)
+            last = offset
+            match = mask_secret(token.decode('ascii'))
+            if (line, match[:6]) in reported:
+                continue
+            findings.append({
+                'check': entropy_check['id'],
+                'title': entropy_check['title'],
+                'risk_level': entropy_check['risk_level'],
+                'category': entropy_check['category'],
+                'file': path,
+                'line': line,
+                'match': match,
+                'pattern': f"entropy {entropy:.2f}"
+            })
+
+    for finding in findings:
+        finding['blob'] = oid
+    return findings
+
+def scan_history(repo, check_ids=HISTORY_CHECKS, entropy=True):
+    """
+    Scans every unique blob of a repository history
+
+    Args:
+        repo: Repository path
+        check_ids: Catalogue checks whose patterns are applied
+        entropy: If True, also reports high-entropy tokens
+
+    Yields:
+        finding dicts (each with the blob id)
+    """
+    index = load_index()
+    specs = build_pattern_specs([index.get(c) for c in check_ids if index.get(c)])
+    matcher = compile_matcher(specs)
+    entropy_check = index.get(ENTROPY_CHECK) if entropy else None
+    for oid, path, content in iter_history_blobs(repo):
+        yield from scan_blob(oid, path, content, matcher, specs, entropy_check)
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan the whole git history for leaked secrets")
+    parser.add_argument('repo', nargs='?', default='.')
+    parser.add_argument('--checks', default=','.join(HISTORY_CHECKS),
+                        help="Comma-separated checks whose patterns are applied")
+    parser.add_argument('--no-entropy', action='store_true', help="Disable entropy scoring")
+    parser.add_argument('--json', action='store_true', help="Print findings as JSON Lines (same as --format jsonl)")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    inside_repo = subprocess.run(['git', '-C', args.repo, 'rev-parse', '--git-dir'],
+                                 capture_output=True).returncode == 0
+    if not inside_repo:
+        print(f"❌ {args.repo} is not a git repository")
+        return 2
+
+    check_ids = [f"{int(c):02d}" for c in args.checks.split(',') if c]
+    findings = scan_history(args.repo, check_ids, entropy=not args.no_entropy)
+    output_format = 'jsonl' if args.json else args.format
+    if output_format in STREAMING_FORMATS:
+        index = load_index()
+        checks = [index.get(c) for c in sorted(set(check_ids) | {ENTROPY_CHECK}) if index.get(c)]
+        return 1 if write_findings(findings, output_format, args.output, checks, args.repo) else 0
+
+    findings = [dict(f, file=f"{f['blob'][:10]}:{f['file']}") for f in findings]
+    print(json.dumps(findings, indent=2) if output_format == 'json' else format_findings(findings))
+    return 1 if findings else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
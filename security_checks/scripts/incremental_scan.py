@@ -0,0 +1,298 @@
+"""
+Incremental Scan - Scans only the files (and hunks) touched by a change
+
+Meant for pre-commit hooks and CI: the changed files come from
+`git diff` (a revision range or the staged changes) or from a file list
+on stdin. Findings are cached per file content hash, so unchanged content
+(including reverted or renamed files) is never scanned twice, and
+findings are reported only for the lines the change touched.
+
+Usage:
+    python incremental_scan.py HEAD~1..HEAD
+    python incremental_scan.py --staged                  # pre-commit hook
+    git diff --name-only main | python incremental_scan.py --stdin
+
+Staged mode scans the staged content (read from the index) and revision
+ranges scan the content of their last revision, so the working tree can
+differ from what is checked.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from check_selector import select_applicable_checks
+from findings_output import STREAMING_FORMATS, add_output_arguments, write_findings
+from security_scanner import MAX_FILE_SIZE, build_pattern_specs, compile_matcher, format_findings, scan_buffer
+
+CACHE_VERSION = 1
+HUNK_RE = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+C_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13, '"': 34, '\\': 92}
+
+def unquote_path(raw):
+    """
+    Decodes a path as written in diff headers
+
+    Git appends a tab to names containing spaces and C-quotes names with
+    special characters (`"b/tab\\there.py"`).
+
+    Args:
+        raw: Path text after '+++ '
+
+    Returns:
+        str path
+    """
+    if raw.endswith('\t'):
+        raw = raw[:-1]
+    if len(raw) < 2 or raw[0] != '"' or raw[-1] != '"':
+        return raw
+    body = raw[1:-1]
+    decoded = bytearray()
+    i = 0
+    while i < len(body):
+        if body[i] == '\\' and i + 1 < len(body):
+            escaped = body[i + 1]
+            if escaped in '01234567':
+                decoded.append(int(body[i + 1:i + 4], 8))
+                i += 4
+                continue
+            decoded.append(C_ESCAPES.get(escaped, ord(escaped)))
+            i += 2
+            continue
+        decoded += body[i].encode('utf-8')
+        i += 1
+    return decoded.decode('utf-8', 'replace')
+
+def content_revision(revision_range=None, staged=False):
+    """
+    Returns where the new side of a diff is read from
+
+    Args:
+        revision_range: Revision range given to git diff
+        staged: If True, the diff is against the index
+
+    Returns:
+        None for the working tree, '' for the index, or a revision
+    """
+    if staged:
+        return ''
+    if not revision_range:
+        return None
+    for separator in ('...', '..'):
+        if separator in revision_range:
+            return revision_range.split(separator, 1)[1] or 'HEAD'
+    if revision_range.endswith('^!'):
+        return revision_range[:-2]
+    # A single revision is diffed against the working tree
+    return None
+
+def git_changed_lines(root, revision_range=None, staged=False):
+    """
+    Lists changed files and the line numbers their changes added
+
+    Args:
+        root: Repository root
+        revision_range: Revision range for git diff (e.g. HEAD~1..HEAD)
+        staged: If True, diffs the staged changes
+
+    Returns:
+        dict mapping relative paths to sets of changed line numbers
+    """
+    command = ['git', '-C', str(root), '-c', 'core.quotepath=off', 'diff', '-U0',
+               '--no-color', '--no-ext-diff', '--diff-filter=d', '--src-prefix=a/', '--dst-prefix=b/']
+    if staged:
+        command.append('--cached')
+    if revision_range:
+        command.append(revision_range)
+    output = subprocess.run(command, capture_output=True, text=True, check=True,
+                            encoding='utf-8', errors='replace').stdout
+
+    changes = {}
+    current = None
+    for line in output.splitlines():
+        if line.startswith('+++ '):
+            target = unquote_path(line[4:])
+            current = target[2:] if target.startswith('b/') else None
+            if current:
+                changes.setdefault(current, set())
+        elif current and line.startswith('@@'):
+            hunk = HUNK_RE.match(line)
+            if hunk:
+                start = int(hunk.group(1))
+                count = int(hunk.group(2)) if hunk.group(2) is not None else 1
+                changes[current].update(range(start, start + count))
+    return changes
+
+def iter_contents(root, paths, revision=None):
+    """
+    Reads the content of changed files from the working tree or from git
+
+    Git content goes through a single `git cat-file --batch` process
+    (`<revision>:<path>`, or `:<path>` for the index).
+
+    Args:
+        root: Repository root
+        paths: Relative paths
+        revision: None (working tree), '' (index) or a revision
+
+    Yields:
+        tuples (path, bytes), bytes being None for missing or oversized files
+    """
+    if revision is None:
+        for relative_path in paths:
+            path = Path(root) / relative_path
+            try:
+                if not path.is_file() or path.stat().st_size > MAX_FILE_SIZE:
+                    yield relative_path, None
+                    continue
+                yield relative_path, path.read_bytes()
+            except OSError:
+                yield relative_path, None
+        return
+
+    process = subprocess.Popen(['git', '-C', str(root), 'cat-file', '--batch'],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        for relative_path in paths:
+            if '\n' in relative_path:
+                yield relative_path, None
+                continue
+            process.stdin.write(f"{revision}:{relative_path}\n".encode('utf-8'))
+            process.stdin.flush()
+            header = process.stdout.readline().split()
+            if len(header) != 3 or header[1] != b'blob':
+                yield relative_path, None
+                continue
+            data = process.stdout.read(int(header[2]) + 1)[:-1]
+            yield relative_path, data if len(data) <= MAX_FILE_SIZE else None
+    finally:
+        process.stdin.close()
+        process.stdout.close()
+        process.wait()
+
+def load_store(path, specs_digest):
+    """
+    Loads the findings store (discarded if the patterns changed)
+
+    Args:
+        path: Store file
+        specs_digest: Digest of the active pattern specs
+
+    Returns:
+        dict with files (content hash -> findings) and paths (path -> content hash)
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            store = json.load(f)
+        if store.get('version') == CACHE_VERSION and store.get('specs') == specs_digest:
+            return store
+    except (OSError, ValueError):
+        pass
+    return {'version': CACHE_VERSION, 'specs': specs_digest, 'files': {}, 'paths': {}}
+
+def save_store(path, store):
+    """Saves the findings store atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(store, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def default_store_path(root):
+    """Returns the store location (inside .git when available)"""
+    git_dir = Path(root) / '.git'
+    return git_dir / 'security-scan-cache.json' if git_dir.is_dir() else Path(root) / '.security-scan-cache.json'
+
+def specs_digest(specs):
+    """Returns a digest identifying a set of pattern specs"""
+    data = json.dumps([[s['check'], s['regex']] for s in specs]).encode()
+    return hashlib.sha256(data).hexdigest()[:16]
+
+def scan_changes(root, changes, store, matcher, specs, revision=None):
+    """
+    Scans changed files, reusing cached findings for known content
+
+    Args:
+        root: Repository root
+        changes: Dict of relative paths to changed lines (None = whole file)
+        store: Findings store (updated in place)
+        matcher: Compiled combined regex
+        specs: Pattern specs
+        revision: Where the content is read from (see content_revision)
+
+    Returns:
+        tuple (findings on changed lines, files scanned, files skipped)
+    """
+    findings = []
+    scanned = 0
+    skipped = 0
+    if not specs:
+        return findings, scanned, skipped
+    for relative_path, data in iter_contents(root, sorted(changes), revision):
+        if data is None:
+            skipped += 1
+            continue
+        lines = changes[relative_path]
+        content_hash = hashlib.sha1(data).hexdigest()
+        cached = store['files'].get(content_hash)
+        if cached is None:
+            cached = [] if b'\0' in data[:8192] else [
+                {k: v for k, v in f.items() if k != 'file'}
+                for f in scan_buffer(data, matcher, specs, relative_path)
+            ]
+            store['files'][content_hash] = cached
+            scanned += 1
+        store['paths'][relative_path] = content_hash
+
+        for finding in cached:
+            if lines is None or finding['line'] in lines:
+                findings.append(dict(finding, file=relative_path))
+    return findings, scanned, skipped
+
+def prune_store(store):
+    """Drops cached findings no longer referenced by any path"""
+    referenced = set(store['paths'].values())
+    store['files'] = {h: f for h, f in store['files'].items() if h in referenced}
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan only the files touched by a change")
+    parser.add_argument('range', nargs='?', help="Revision range for git diff (default: working tree vs index)")
+    parser.add_argument('--staged', action='store_true', help="Scan staged changes (pre-commit)")
+    parser.add_argument('--stdin', action='store_true', help="Read file paths from stdin (whole files)")
+    parser.add_argument('--root', default='.', help="Repository root")
+    parser.add_argument('--store', help="Findings store file (default: .git/security-scan-cache.json)")
+    parser.add_argument('--json', action='store_true', help="Print findings as JSON (same as --format json)")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if args.stdin:
+        changes = {line.strip(): None for line in sys.stdin if line.strip()}
+    else:
+        changes = git_changed_lines(root, args.range, staged=args.staged)
+
+    checks = select_applicable_checks(root)
+    specs = build_pattern_specs(checks)
+    store_path = args.store or default_store_path(root)
+    store = load_store(store_path, specs_digest(specs))
+    revision = None if args.stdin else content_revision(args.range, args.staged)
+    findings, scanned, skipped = scan_changes(root, changes, store, compile_matcher(specs), specs, revision)
+    prune_store(store)
+    save_store(store_path, store)
+
+    if args.format in STREAMING_FORMATS:
+        write_findings(findings, args.format, args.output, checks, root)
+    elif args.json or args.format == 'json':
+        print(json.dumps(findings, indent=2))
+    else:
+        cached = len(changes) - scanned - skipped
+        print(f"🔍 {len(changes)} changed files ({scanned} scanned, {cached} cached, {skipped} skipped)")
+        print(format_findings(findings))
+    return 1 if findings else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
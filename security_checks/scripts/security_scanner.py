@@ -0,0 +1,414 @@
+"""
+Security Scanner - Runs the detection patterns of the security_checks catalogue
+
+All patterns (grep commands extracted from the check documents, or the
+patterns declared below) are compiled into a single combined regex, so
+every file is read exactly once (through mmap) no matter how many checks
+are active. The combined regex only finds the lines with a hit; those
+lines are then matched against every pattern separately, so overlapping
+matches of different checks are all reported. Files are scanned in parallel across a process pool and
+findings are tagged with the check number and risk level.
+
+Usage:
+    python security_scanner.py [path] [--checks 03,14] [--min-risk HIGH] [--json]
+    python security_scanner.py [path] --format sarif --output findings.sarif
+"""
+
+import argparse
+import functools
+import json
+import mmap
+import os
+import re
+import sys
+from pathlib import Path
+
+from catalog_index import load_index
+from catalog_parser import CATALOG_ROOT, RISK_LEVELS
+from check_selector import IGNORED_DIRS, select_applicable_checks
+from findings_output import STREAMING_FORMATS, add_output_arguments, write_findings
+
+# Patterns declared per check. They replace the grep commands extracted from
+# the document when those are too broad (or flag the secure alternative).
+DECLARED_PATTERNS = {
+    '03': [
+        r'AKIA[0-9A-Z]{16}',
+        r'sk_live_[0-9a-zA-Z]{10,}',
+        r'AIza[0-9A-Za-z_\-]{35}',
+        r'xox[baprs]-[0-9A-Za-z\-]{10,}',
+        r'(?:mongodb(?:\+srv)?|postgres(?:ql)?|mysql)://[^\s:/@]+:[^\s@]+@',
+        r'-----BEGIN (?:RSA |EC |OPENSSH )?PRIVATE KEY-----'
+    ],
+    '05': [
+        r'admin@(?:example|test)\.com',
+        r'(?i)[\'"](?:password123|admin123|changeme)[\'"]'
+    ],
+    '09': [
+        r'res\.(?:send|json)\(\s*\{?\s*(?:error:\s*)?err(?:or)?\.(?:message|stack)'
+    ],
+    '11': [
+        r'^[ \t]*DEBUG\s*=\s*True\b',
+        r'NODE_ENV\s*[=:]\s*[\'"]?development'
+    ],
+    '15': [
+        r'Access-Control-Allow-Origin[\'"]?\s*[:,]\s*[\'"]?\*',
+        r'origin\s*:\s*[\'"]\*[\'"]',
+        r'allow_origins\s*=\s*\[\s*[\'"]\*[\'"]'
+    ],
+    '22': [
+        r'(?:fetch|axios\.(?:get|post)|requests\.(?:get|post))\(\s*req(?:uest)?\.(?:body|query|params)'
+    ],
+    '24': [
+        r'__proto__',
+        r'constructor\s*\[\s*[\'"]prototype[\'"]'
+    ],
+    '25': [
+        r'(?:localStorage|sessionStorage)\.setItem\(\s*[\'"][^\'"]*(?:token|auth|session|jwt)',
+    ],
+    '27': [
+        r'(?i)password\s*[:=]\s*[\'"][^\'"\s]{4,}[\'"]',
+        r'(?i)INSERT INTO.*password',
+        r'(?i)password.*req\.body'
+    ],
+    '28': [
+        r'createHash\(\s*[\'"](?:md5|sha1)[\'"]',
+        r'hashlib\.(?:md5|sha1)\(',
+        r'createCipher\('
+    ],
+    '34': [
+        r'(?:readFile(?:Sync)?|createReadStream|sendFile|path\.join)\([^)]*req\.(?:params|query|body)'
+    ],
+    '36': [
+        r'jwt\.decode\(',
+        r'verify_signature[\'"]?\s*:\s*False',
+        r'algorithms\s*[=:]\s*\[\s*[\'"]none[\'"]'
+    ],
+    '39': [
+        r'dangerouslySetInnerHTML',
+        r'\bv-html\b',
+        r'\.innerHTML\s*=',
+        r'document\.write\('
+    ],
+    '42': [
+        r'(?:console\.log|logger\.(?:info|debug))\(\s*(?:req\.body|password)'
+    ],
+    '45': [
+        r'pickle\.loads?\(',
+        r'yaml\.load\((?![^)]*Loader)',
+        r'ObjectInputStream',
+        r'unserialize\('
+    ]
+}
+
+MAX_FILE_SIZE = 5 * 1024 * 1024
+MAX_MATCH_LENGTH = 120
+
+_matcher = None
+
+def build_pattern_specs(checks, declared=DECLARED_PATTERNS):
+    """
+    Lists the patterns of each check (declared patterns take precedence)
+
+    Args:
+        checks: Check records (from the catalogue index)
+        declared: Dict of declared patterns by check id
+
+    Returns:
+        list of dicts with check, title, risk_level, category and regex
+    """
+    specs = []
+    for check in checks:
+        if check['id'] in declared:
+            regexes = declared[check['id']]
+        else:
+            regexes = [f"(?i:{p['regex']})" if p['ignore_case'] else p['regex']
+                       for p in check['grep_patterns']]
+        for regex in regexes:
+            specs.append({
+                'check': check['id'],
+                'title': check['title'],
+                'risk_level': check['risk_level'],
+                'category': check['category'],
+                'regex': regex
+            })
+    return specs
+
+def scoped_regex(regex):
+    """
+    Moves leading global flags like (?i) into a scoped group
+
+    Global flags are only allowed at the start of the whole expression,
+    so they must be scoped before patterns are combined.
+
+    Args:
+        regex: Pattern
+
+    Returns:
+        str with an equivalent pattern safe to embed in an alternation
+    """
+    flags = re.match(r'^\(\?([aiLmsux]+)\)', regex)
+    if flags:
+        return f"(?{flags.group(1)}:{regex[flags.end():]})"
+    return f"(?:{regex})"
+
+def compile_matcher(specs):
+    """
+    Compiles all patterns into one bytes regex with a named group per pattern
+
+    Args:
+        specs: Pattern specs from build_pattern_specs
+
+    Returns:
+        compiled regex (group p<N> identifies specs[N])
+    """
+    alternatives = [f"(?P<p{i}>{scoped_regex(spec['regex'])})" for i, spec in enumerate(specs)]
+    return re.compile('|'.join(alternatives).encode(), re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
+def compile_spec(regex):
+    """Compiles the bytes regex of a single pattern spec"""
+    return re.compile(regex.encode(), re.MULTILINE)
+
+def iter_files(root, exclude=None):
+    """
+    Yields the files of a tree that should be scanned
+
+    Args:
+        root: Root directory (or a single file)
+        exclude: Optional list of resolved paths to skip
+
+    Yields:
+        str file paths
+    """
+    exclude = [str(Path(p).resolve()) for p in (exclude or [])]
+    root = Path(root)
+    if root.is_file():
+        yield str(root)
+        return
+    for current, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in IGNORED_DIRS
+                   and str(Path(current, d).resolve()) not in exclude]
+        for name in files:
+            yield os.path.join(current, name)
+
+def scan_buffer(buffer, matcher, specs, path):
+    """
+    Runs the combined matcher over a buffer
+
+    Each line span with a hit of the combined regex is matched again
+    against every pattern, since an alternation only reports one of the
+    patterns matching at a position (and a greedy one hides the rest of
+    the line).
+
+    Args:
+        buffer: bytes or mmap with the file content
+        matcher: Compiled combined regex
+        specs: Pattern specs
+        path: File path reported in findings
+
+    Returns:
+        list of finding dicts
+    """
+    findings = []
+    line = 1
+    last = 0
+    position = 0
+    size = len(buffer)
+    while position < size:
+        match = matcher.search(buffer, position)
+        if not match:
+            break
+        start = buffer.rfind(b'\n', 0, match.start()) + 1
+        end = buffer.find(b'\n', max(match.end() - 1, match.start()))
+        end = size if end == -1 else end
+        line += buffer[last:start].count(b'\n')
+        last = start
+
+        hits = []
+        for index, spec in enumerate(specs):
+            for hit in compile_spec(spec['regex']).finditer(buffer, start, end):
+                hits.append((hit.start(), index, hit.group()))
+        for offset, index, text in sorted(hits):
+            spec = specs[index]
+            findings.append({
+                'check': spec['check'],
+                'title': spec['title'],
+                'risk_level': spec['risk_level'],
+                'category': spec['category'],
+                'file': path,
+                'line': line + buffer[start:offset].count(b'\n'),
+                'match': text.decode('utf-8', 'replace')[:MAX_MATCH_LENGTH],
+                'pattern': spec['regex']
+            })
+        position = end + 1
+    return findings
+
+def scan_file(path, matcher, specs):
+    """
+    Scans one file through mmap (binary and oversized files are skipped)
+
+    Args:
+        path: File path
+        matcher: Compiled combined regex
+        specs: Pattern specs
+
+    Returns:
+        list of finding dicts
+    """
+    try:
+        size = os.path.getsize(path)
+        if size == 0 or size > MAX_FILE_SIZE:
+            return []
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if b'\0' in mm[:8192]:
+                return []
+            return scan_buffer(mm, matcher, specs, path)
+    except (OSError, ValueError):
+        return []
+
+def _init_worker(specs):
+    global _matcher
+    _matcher = (compile_matcher(specs), specs)
+
+def _scan_chunk(paths):
+    matcher, specs = _matcher
+    findings = []
+    for path in paths:
+        findings.extend(scan_file(path, matcher, specs))
+    return findings
+
+def select_checks(checks, check_ids=None, min_risk=None):
+    """
+    Filters checks by id and minimum risk level
+
+    Args:
+        checks: Check records
+        check_ids: Optional iterable of check ids ('03', '14', ...)
+        min_risk: Optional minimum risk level ('HIGH' keeps CRITICAL and HIGH)
+
+    Returns:
+        list of selected checks
+    """
+    if check_ids:
+        wanted = {f"{int(c):02d}" for c in check_ids}
+        checks = [c for c in checks if c['id'] in wanted]
+    if min_risk:
+        allowed = RISK_LEVELS[:RISK_LEVELS.index(min_risk.upper()) + 1]
+        checks = [c for c in checks if c['risk_level'] in allowed]
+    return checks
+
+def iter_scan_paths(paths, specs, workers=None, chunk_size=64):
+    """
+    Scans a list of files across a process pool, yielding findings as chunks complete
+
+    Args:
+        paths: File paths
+        specs: Pattern specs
+        workers: Number of processes (defaults to CPU count, 0 scans in-process)
+        chunk_size: Files per task
+
+    Yields:
+        finding dicts, in path order
+    """
+    if not specs:
+        return
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    if workers == 0 or len(chunks) <= 1:
+        _init_worker(specs)
+        for chunk in chunks:
+            yield from _scan_chunk(chunk)
+    else:
+        # Imported here: concurrent.futures.process alone doubles the startup time
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(specs,)) as pool:
+            for chunk_findings in pool.map(_scan_chunk, chunks):
+                yield from chunk_findings
+
+def scan_paths(paths, specs, workers=None, chunk_size=64):
+    """
+    Scans a list of files across a process pool
+
+    Args:
+        paths: File paths
+        specs: Pattern specs
+        workers: Number of processes (defaults to CPU count, 0 scans in-process)
+        chunk_size: Files per task
+
+    Returns:
+        list of finding dicts sorted by file and line
+    """
+    findings = iter_scan_paths(paths, specs, workers=workers, chunk_size=chunk_size)
+    return sorted(findings, key=lambda f: (f['file'], f['line']))
+
+def scan_tree(root, checks=None, workers=None, exclude=None):
+    """
+    Scans a project with the catalogue patterns
+
+    Args:
+        root: Project root (or a single file)
+        checks: Checks to run (defaults to the checks applicable to the project)
+        workers: Number of processes
+        exclude: Paths to skip (defaults to the catalogue itself)
+
+    Returns:
+        list of finding dicts
+    """
+    if checks is None:
+        project = Path(root) if Path(root).is_dir() else Path(root).parent
+        checks = select_applicable_checks(project)
+    exclude = [CATALOG_ROOT] if exclude is None else exclude
+    specs = build_pattern_specs(checks)
+    return scan_paths(list(iter_files(root, exclude)), specs, workers=workers)
+
+def format_findings(findings):
+    """
+    Formats findings grouped by check
+
+    Args:
+        findings: List of finding dicts
+
+    Returns:
+        str with the report
+    """
+    if not findings:
+        return "✅ No findings"
+    lines = []
+    by_check = {}
+    for finding in findings:
+        by_check.setdefault(finding['check'], []).append(finding)
+    for check_id in sorted(by_check, key=lambda c: (RISK_LEVELS.index(by_check[c][0]['risk_level'] or 'LOW'), c)):
+        group = by_check[check_id]
+        lines.append(f"\n[{group[0]['risk_level']}] {check_id}. {group[0]['title']} ({len(group)})")
+        for finding in group:
+            lines.append(f"  {finding['file']}:{finding['line']}: {finding['match']}")
+    lines.append(f"\nTotal: {len(findings)} findings")
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan a project with the security_checks patterns")
+    parser.add_argument("path", nargs="?", default=".")
+    parser.add_argument("--checks", help="Comma-separated check numbers (default: all applicable)")
+    parser.add_argument("--all-checks", action="store_true",
+                        help="Run every check, even those for technologies the project does not use")
+    parser.add_argument("--min-risk", choices=RISK_LEVELS)
+    parser.add_argument("--workers", type=int, help="Number of processes (0 = in-process)")
+    parser.add_argument("--json", action="store_true", help="Print findings as JSON (same as --format json)")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    project = Path(args.path) if Path(args.path).is_dir() else Path(args.path).parent
+    checks = load_index().all() if args.all_checks else select_applicable_checks(project)
+    checks = select_checks(checks, args.checks.split(',') if args.checks else None, args.min_risk)
+    if args.format in STREAMING_FORMATS:
+        specs = build_pattern_specs(checks)
+        findings = iter_scan_paths(list(iter_files(args.path, [CATALOG_ROOT])), specs, workers=args.workers)
+        return 1 if write_findings(findings, args.format, args.output, checks, project) else 0
+
+    findings = scan_tree(args.path, checks, workers=args.workers)
+    print(json.dumps(findings, indent=2) if args.json or args.format == 'json' else format_findings(findings))
+    return 1 if findings else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
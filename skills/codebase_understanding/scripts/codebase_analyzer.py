@@ -48,6 +48,7 @@ def identify_technologies(root_path):
         dict with identified technologies
     """
     technologies = {
+        'name': None,
         'framework': None,
         'language': None,
         'build_tool': None,
@@ -60,6 +61,7 @@ def identify_technologies(root_path):
     if package_json.exists():
         with open(package_json) as f:
             data = json.load(f)
+            technologies['name'] = data.get('name')
             technologies['framework'] = 'React' if 'react' in data.get('dependencies', {}) else 'Node.js'
             technologies['language'] = 'TypeScript' if 'typescript' in data.get('devDependencies', {}) else 'JavaScript'
             technologies['build_tool'] = 'Vite' if 'vite' in data.get('devDependencies', {}) else 'Webpack'
@@ -0,0 +1,206 @@
+"""
+Context Builder - Builds compact project context for prompts
+
+Reuses codebase_analyzer to detect the stack, memoizes the result per
+project root (invalidated when manifests or top-level directories change)
+and keeps the rendered context within a token budget.
+"""
+
+import os
+from pathlib import Path
+
+from codebase_analyzer import identify_technologies
+
+DEFAULT_CONTEXT_TOKENS = 500
+
+# Files whose changes invalidate the cached context
+MANIFEST_FILES = [
+    'package.json',
+    'requirements.txt',
+    'pyproject.toml',
+    'Cargo.toml',
+    'go.mod'
+]
+
+IGNORED_DIRS = ['.git', 'node_modules', 'venv', '.venv', '__pycache__']
+
+_context_cache = {}
+
+def estimate_tokens(text):
+    """
+    Estimates the number of tokens of a text (~4 characters per token)
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int with estimated tokens
+    """
+    return (len(text) + 3) // 4
+
+def project_fingerprint(root_path):
+    """
+    Computes a cheap fingerprint of the files the context depends on
+
+    Only stats manifests and the root/src directories (whose mtime changes
+    when entries are added or removed), so it stays fast on huge repos.
+
+    Args:
+        root_path: Project root path
+
+    Returns:
+        tuple identifying the current project state
+    """
+    root = Path(root_path)
+    fingerprint = []
+    for name in MANIFEST_FILES + ['.', 'src']:
+        try:
+            stat = os.stat(root / name)
+            fingerprint.append((name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((name, None, None))
+    return tuple(fingerprint)
+
+def list_directories(path, limit=10):
+    """
+    Lists the visible subdirectories of a path
+
+    Args:
+        path: Directory to list
+        limit: Maximum number of directories returned
+
+    Returns:
+        list of directory names
+    """
+    try:
+        with os.scandir(path) as entries:
+            dirs = sorted(e.name for e in entries
+                          if e.is_dir() and e.name not in IGNORED_DIRS and not e.name.startswith('.'))
+    except OSError:
+        return []
+    return dirs[:limit]
+
+def build_context_sections(root_path):
+    """
+    Builds the ranked context sections of a project
+
+    Args:
+        root_path: Project root path
+
+    Returns:
+        list of dicts with title, priority (lower is more important) and content
+    """
+    root = Path(root_path)
+    technologies = identify_technologies(root)
+    sections = [{'title': 'Project', 'priority': 0, 'content': f"Project path: {root}"}]
+
+    stack = [f"{label}: {technologies[key]}" for key, label in [
+        ('name', 'Name'),
+        ('language', 'Language'),
+        ('framework', 'Framework'),
+        ('build_tool', 'Build tool'),
+        ('testing', 'Testing')
+    ] if technologies.get(key)]
+    if stack:
+        sections.append({'title': 'Stack', 'priority': 1, 'content': "\n".join(stack)})
+
+    if technologies['libraries']:
+        sections.append({
+            'title': 'Dependencies',
+            'priority': 2,
+            'content': f"Main dependencies: {', '.join(technologies['libraries'])}"
+        })
+
+    structure = []
+    top_level = list_directories(root)
+    if top_level:
+        structure.append(f"Top-level directories: {', '.join(top_level)}")
+    src_dirs = list_directories(root / 'src')
+    if src_dirs:
+        structure.append(f"Directories in src/: {', '.join(src_dirs)}")
+    if structure:
+        sections.append({'title': 'Structure', 'priority': 3, 'content': "\n".join(structure)})
+
+    return sections
+
+def get_context_sections(root_path):
+    """
+    Returns the context sections of a project, memoized by root path
+
+    Args:
+        root_path: Project root path
+
+    Returns:
+        list of context sections
+    """
+    key = str(Path(root_path).resolve())
+    fingerprint = project_fingerprint(key)
+    cached = _context_cache.get(key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    sections = build_context_sections(key)
+    _context_cache[key] = (fingerprint, sections)
+    return sections
+
+def clear_context_cache():
+    """Clears the memoized project contexts"""
+    _context_cache.clear()
+
+def fit_to_budget(sections, max_tokens):
+    """
+    Keeps the most important sections that fit in a token budget
+
+    Sections are taken by priority; the first one that does not fit is
+    truncated line by line and everything after it is dropped.
+
+    Args:
+        sections: List of context sections
+        max_tokens: Token budget
+
+    Returns:
+        list of section contents that fit
+    """
+    parts = []
+    remaining = max_tokens
+    for section in sorted(sections, key=lambda s: s['priority']):
+        cost = estimate_tokens(section['content']) + 1
+        if cost <= remaining:
+            parts.append(section['content'])
+            remaining -= cost
+            continue
+
+        # Truncate the section to what is left of the budget
+        kept = []
+        for line in section['content'].split("\n"):
+            line_cost = estimate_tokens(line) + 1
+            if line_cost > remaining:
+                if remaining > 8:
+                    kept.append(line[:(remaining - 2) * 4] + "...")
+                break
+            kept.append(line)
+            remaining -= line_cost
+        if kept:
+            parts.append("\n".join(kept))
+        break
+    return parts
+
+def get_project_context(root_path, max_tokens=DEFAULT_CONTEXT_TOKENS, extra_sections=None):
+    """
+    Gets project context to include in a prompt
+
+    Args:
+        root_path: Project root path
+        max_tokens: Maximum estimated tokens of the returned context
+        extra_sections: Optional additional sections ranked with the project ones
+
+    Returns:
+        str with project context
+    """
+    sections = get_context_sections(root_path) + list(extra_sections or [])
+    return "\n".join(fit_to_budget(sections, max_tokens))
+
+if __name__ == '__main__':
+    import sys
+
+    print(get_project_context(sys.argv[1] if len(sys.argv) > 1 else '.'))
@@ -0,0 +1,157 @@
+"""
+Skills CLI - Single entry point for the skill scripts
+
+Subcommands:
+    analyze       Codebase summary or prompt context (codebase_understanding)
+    requirements  Structured requirements analysis (requirements_analyzer)
+    protocol      Sends a requirement through the complete protocol (or --dry-run)
+    scan          Security scan with the security_checks catalogue
+
+Every module is imported inside its subcommand, so the local subcommands
+never load the Anthropic SDK or python-dotenv; only `protocol` without
+--dry-run does.
+
+Usage:
+    python skills_cli.py analyze [path] [--context] [--json]
+    python skills_cli.py requirements "Add a logout button" [--json]
+    python skills_cli.py protocol "Add a logout button" --project . [--stream | --dry-run]
+    python skills_cli.py scan [path] [scanner options...]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPT_DIRS = [
+    os.path.join(ROOT_DIR, 'skills', 'codebase_understanding', 'scripts'),
+    os.path.join(ROOT_DIR, 'skills', 'requirements_analyzer', 'scripts'),
+    os.path.join(ROOT_DIR, 'skills', 'project_protocol', 'scripts'),
+    os.path.join(ROOT_DIR, 'security_checks', 'scripts'),
+    os.path.join(ROOT_DIR, 'examples')
+]
+
+def command_analyze(args):
+    """Prints the codebase summary (or the prompt context) of a project"""
+    if args.context:
+        from context_builder import get_project_context
+
+        print(get_project_context(args.path, max_tokens=args.max_tokens))
+        return 0
+
+    from codebase_analyzer import generate_codebase_summary
+
+    summary = generate_codebase_summary(args.path)
+    if args.json:
+        import json
+
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    stack = summary['technology_stack']
+    structure = summary['structure']
+    print(f"📁 {summary['path']}")
+    for key in ['name', 'language', 'framework', 'build_tool', 'testing']:
+        if stack.get(key):
+            print(f"   {key.replace('_', ' ').capitalize()}: {stack[key]}")
+    if stack['libraries']:
+        print(f"   Libraries: {', '.join(stack['libraries'])}")
+    print(f"   Directories: {len(structure['directories'])}, files: {len(structure['files'])}")
+    for key, value in summary['conventions'].items():
+        if value:
+            print(f"   {key.capitalize()} naming: {value}")
+    return 0
+
+def command_requirements(args):
+    """Prints the structured analysis of a requirement"""
+    from requirements_parser import format_requirements_template, structure_requirements_analysis
+
+    text = ' '.join(args.text) if args.text else sys.stdin.read()
+    if not text.strip():
+        print("❌ No requirement given")
+        return 2
+    analysis = structure_requirements_analysis(text)
+    if args.json:
+        import json
+
+        print(json.dumps(analysis, indent=2))
+    else:
+        print(format_requirements_template(analysis))
+    return 0
+
+def command_protocol(args):
+    """Sends a requirement through the complete development protocol"""
+    text = ' '.join(args.text) if args.text else sys.stdin.read()
+    if not text.strip():
+        print("❌ No requirement given")
+        return 2
+
+    if args.dry_run:
+        import json
+
+        from protocol_request import build_protocol_message, build_request_params
+
+        project_context = None
+        if args.project:
+            from complete_example import get_project_context
+
+            project_context = get_project_context(args.project)
+        params = build_request_params(build_protocol_message(text, project_context))
+        print(json.dumps(params, indent=2))
+        return 0
+
+    from complete_example import develop_with_protocol
+    from instrumentation import format_summary
+
+    develop_with_protocol(text, project_path=args.project, verbose=True, stream=args.stream,
+                          prompt_name=args.prompt_name)
+    print("\n📈 API Metrics:")
+    print(format_summary())
+    return 0
+
+def command_scan(args):
+    """Runs the security scanner with the remaining arguments"""
+    import security_scanner
+
+    sys.argv = ['security_scanner.py'] + args.scanner_args
+    return security_scanner.main()
+
+def build_parser():
+    """Builds the argument parser of the CLI"""
+    parser = argparse.ArgumentParser(prog='skills', description="Skill scripts of the template")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    analyze = subparsers.add_parser('analyze', help="Analyze a codebase")
+    analyze.add_argument('path', nargs='?', default='.')
+    analyze.add_argument('--context', action='store_true', help="Print the compact prompt context instead")
+    analyze.add_argument('--max-tokens', type=int, default=500, help="Token budget of --context")
+    analyze.add_argument('--json', action='store_true', help="Print the summary as JSON")
+    analyze.set_defaults(handler=command_analyze)
+
+    requirements = subparsers.add_parser('requirements', help="Structure a requirement (text or stdin)")
+    requirements.add_argument('text', nargs='*')
+    requirements.add_argument('--json', action='store_true', help="Print the analysis as JSON")
+    requirements.set_defaults(handler=command_requirements)
+
+    protocol = subparsers.add_parser('protocol', help="Develop a requirement with the complete protocol")
+    protocol.add_argument('text', nargs='*')
+    protocol.add_argument('--project', help="Project path included as context")
+    protocol.add_argument('--stream', action='store_true', help="Render the response as it arrives")
+    protocol.add_argument('--prompt-name', help="Label of the request metrics")
+    protocol.add_argument('--dry-run', action='store_true', help="Print the request instead of sending it")
+    protocol.set_defaults(handler=command_protocol)
+
+    scan = subparsers.add_parser('scan', help="Scan a project with the security checks",
+                                 description="Arguments are passed to security_scanner.py")
+    scan.add_argument('scanner_args', nargs=argparse.REMAINDER)
+    scan.set_defaults(handler=command_scan)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sys.path[:0] = SCRIPT_DIRS
+    return args.handler(args)
+
+if __name__ == '__main__':
+    sys.exit(main())